@@ -4,8 +4,15 @@ from ui import UI
 import time
 import threading
 import os
+import re
+import json
+import tempfile
 import queue
 import functools
+import concurrent.futures
+import select
+import signal
+import sys
 
 # Define event types for event-driven architecture
 EVENT_PLAYBACK_ENDED = "playback_ended"
@@ -13,56 +20,239 @@ EVENT_PLAYBACK_STARTED = "playback_started"
 EVENT_DOWNLOAD_COMPLETED = "download_completed"
 EVENT_OPERATION_COMPLETED = "operation_completed"
 EVENT_ERROR = "error"
+EVENT_TASK_COMPLETED = "task_completed"
+
+# Maximum number of concurrent yt-dlp downloads for the 'dla' command
+DOWNLOAD_ALL_WORKERS = 5
+# Worker threads shared by all background tasks (metadata fetches, adds, ...)
+BACKGROUND_WORKERS = 8
+
+# How often (in seconds) the UI is refreshed while a song is playing
+PLAYBACK_TICK_INTERVAL = 1.0
+# Minimum time between background-triggered redraws (caps the UI at ~4 FPS)
+MIN_FRAME_INTERVAL = 0.25
+
+# On-disk cache of yt-dlp metadata so known songs skip the network lookup.
+# Entries are keyed by canonical_url() so watch?v=, youtu.be and shared
+# links for the same video all hit the same entry.
+SONG_INFO_CACHE_FILE = os.path.join(".cache", "song_info.json")
+SONG_INFO_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+# New entries are batched and written this many seconds after the first one
+SONG_INFO_SAVE_DELAY = 2.0
+
+# Anything that is not alphanumeric (per str.isalnum), a space, '-' or '_'
+_UNSAFE_TITLE_RE = re.compile(r'[^\w \-]')
+
+@functools.lru_cache(maxsize=4096)
+def safe_title(title):
+    """Return a filesystem-safe version of a song title"""
+    return _UNSAFE_TITLE_RE.sub('_', title)
+
+_YOUTUBE_ID_RE = re.compile(r'(?:youtu\.be/|youtube\.com/(?:shorts/|embed/|live/)|[?&]v=)([\w-]{11})')
+
+@functools.lru_cache(maxsize=2048)
+def canonical_url(url):
+    """Return a cache key that is identical for every URL form of the same video"""
+    match = _YOUTUBE_ID_RE.search(url)
+    if match:
+        return f"yt:{match.group(1)}"
+    return url.strip()
 
 class TerminalMusicPlayerApp:
-    """Main application class using event-driven architecture"""
+    """Main application class using event-driven architecture
+    
+    Application state (current_index, the playlist, UI messages) is only
+    mutated on the main loop: background tasks hand their results back
+    through the event queue. The only state shared with worker threads is
+    downloaded_songs and song_info_cache, each guarded by its own lock, so
+    the app is also safe on free-threaded (no-GIL) Python builds.
+    """
     
     def __init__(self):
         self.playlist_manager = PlaylistManager()
         self.player = MusicPlayer()
-        self.ui = UI()
+        # Set whenever visible state changes so the main loop only redraws when needed
+        self.redraw_event = threading.Event()
+        self.ui = UI(redraw_event=self.redraw_event)
         
         # Application state
         self.current_index = 0
         self.is_running = True
         self.downloaded_songs = {}
+        self.present_files = set()
+        self.downloads_lock = threading.Lock()
         self.event_queue = queue.Queue()
+        # Self-pipe that wakes the main loop's select() when an event is posted
+        self.wake_r, self.wake_w = os.pipe()
+        os.set_blocking(self.wake_r, False)
+        os.set_blocking(self.wake_w, False)
+        self.resize_pending = False
+        self.song_info_lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=BACKGROUND_WORKERS, thread_name_prefix="bg"
+        )
+        
+        # Single-song downloads (dl, auto-download) are served by one worker thread
+        self.download_queue = queue.Queue()
+        self.download_thread = threading.Thread(target=self._download_worker, daemon=True)
+        self.download_thread.start()
+        self.song_info_cache = self._load_song_info_cache()
+        self.song_info_save_timer = None
+        
+        # URL -> playlist index, rebuilt whenever songs are added, edited or removed
+        self.url_to_index = {}
+        self._rebuild_url_index()
         
         # Load downloaded songs cache
         self._load_downloaded_songs()
+        
+        # Command dispatch table, built once instead of on every keystroke
+        self.command_handlers = {
+            'q': self._cmd_quit,
+            'p': self._cmd_play,
+            's': self._cmd_stop,
+            'n': self._cmd_next,
+            'prev': self._cmd_prev,
+            'r': self._cmd_toggle_shuffle,
+            'a': self._cmd_add_song,
+            'e': self._cmd_edit_song,
+            'd': self._cmd_delete_song,
+            'i': self._cmd_get_song_info,
+            'I': self._cmd_refresh_song_info,  # Not 'ri': 'r' fires shuffle at once
+            'save': self._cmd_save_playlist,
+            'dl': self._cmd_download_current,
+            'auto': self._cmd_toggle_auto_download,
+            'dla': self._cmd_download_all,
+            'pause': self._cmd_pause,  # New command for pause/resume
+        }
+    
+    def _rebuild_url_index(self):
+        """Rebuild the URL -> playlist index lookup table"""
+        self.url_to_index = {song["url"]: i for i, song in enumerate(self.playlist_manager.get_songs())}
+    
+    def _load_song_info_cache(self):
+        """Load cached song metadata from disk"""
+        try:
+            with open(SONG_INFO_CACHE_FILE, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        except Exception as e:
+            self.ui.add_message(f"Gagal memuat cache info lagu: {e}", error=True)
+            return {}
+    
+    def _schedule_song_info_save(self):
+        """Write the metadata cache shortly, coalescing bursts of new entries"""
+        with self.song_info_lock:
+            if self.song_info_save_timer is None:
+                self.song_info_save_timer = threading.Timer(SONG_INFO_SAVE_DELAY, self._save_song_info_cache)
+                self.song_info_save_timer.daemon = True
+                self.song_info_save_timer.start()
+    
+    def _save_song_info_cache(self):
+        """Atomically write the song metadata cache to disk
+        
+        Usually runs on a Timer thread, so failures are reported through
+        the event queue instead of raising.
+        """
+        with self.song_info_lock:
+            if self.song_info_save_timer is not None:
+                self.song_info_save_timer.cancel()
+                self.song_info_save_timer = None
+            data = dict(self.song_info_cache)
+        try:
+            cache_dir = os.path.dirname(SONG_INFO_CACHE_FILE)
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir, delete=False)
+            try:
+                with tmp:
+                    json.dump(data, tmp, ensure_ascii=False)
+                os.replace(tmp.name, SONG_INFO_CACHE_FILE)
+            except BaseException:
+                # Don't leave a stray temp file in the cache directory
+                os.unlink(tmp.name)
+                raise
+        except Exception as e:
+            self._post_event(EVENT_ERROR, f"Gagal menyimpan cache info lagu: {e}")
     
     def _load_downloaded_songs(self):
         """Load cache of previously downloaded songs"""
         songs = self.playlist_manager.get_songs()
-        if os.path.exists("downloads"):
-            for song in songs:
-                safe_title = "".join([c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in song["title"]])
-                potential_file = f"downloads/{safe_title}.mp3"
-                if os.path.exists(potential_file):
-                    self.downloaded_songs[song["url"]] = potential_file
         
         # Create downloads directory if it doesn't exist
-        if not os.path.exists("downloads"):
-            os.makedirs("downloads")
+        os.makedirs("downloads", exist_ok=True)
+        
+        # One directory read instead of a stat() per song; the set is kept up
+        # to date by _download_song so later downloads can skip the disk check
+        with os.scandir("downloads") as entries:
+            self.present_files = {entry.name for entry in entries if entry.is_file()}
+        
+        for song in songs:
+            filename = f"{safe_title(song['title'])}.mp3"
+            if filename in self.present_files:
+                self.downloaded_songs[song["url"]] = f"downloads/{filename}"
     
     def run(self):
         """Main application loop using event-driven approach"""
         # Start with initial UI render
         self._update_ui()
         
+        # Fill in unknown durations without holding up the first frame; the
+        # worker only fetches, the songs are updated back on the main loop
+        self._run_in_background(
+            self.playlist_manager.fetch_all_durations,
+            self.playlist_manager.unknown_duration_urls(),
+            callback=self._after_durations_fetched
+        )
+        last_tick = last_render = time.monotonic()
+        
+        # The window-size signal wakes select() through the self-pipe
+        signal.signal(signal.SIGWINCH, self._on_terminal_resize)
+        signal.set_wakeup_fd(self.wake_w)
+        
         # Main event loop
         while self.is_running:
             try:
+                # Sleep until a key is pressed, a background thread posts an
+                # event, or the playback clock needs a tick
+                timeout = self._wait_timeout(last_tick, last_render)
+                try:
+                    readable, _, _ = select.select([sys.stdin, self.wake_r], [], [], timeout)
+                except InterruptedError:
+                    readable = []
+                if self.wake_r in readable:
+                    try:
+                        while os.read(self.wake_r, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                if self.resize_pending:
+                    self.resize_pending = False
+                    self.ui.handle_terminal_resize()
+                
                 # Process any pending events
                 self._process_events()
                 
-                # Get user command with short timeout for responsiveness
-                command = self.ui.get_command(timeout=0.3)
-                if command:
+                # Handle every command typed since the last pass
+                commands = self.ui.read_commands() if sys.stdin in readable else []
+                for command in commands:
                     self._handle_command(command)
+                    self.redraw_event.set()
+                
+                # Playback time only changes once per second, so tick at that rate
+                now = time.monotonic()
+                if now - last_tick >= PLAYBACK_TICK_INTERVAL:
+                    last_tick = now
+                    if self.player.is_playing():
+                        self.redraw_event.set()
                 
-                # Update UI after each command or timeout
-                self._update_ui()
+                # Only redraw when something actually changed. Keystrokes are
+                # drawn immediately; background updates are rate limited.
+                if self.redraw_event.is_set() and (
+                        commands or now - last_render >= MIN_FRAME_INTERVAL):
+                    self.redraw_event.clear()
+                    last_render = now
+                    self._update_ui()
                 
             except KeyboardInterrupt:
                 self.is_running = False
@@ -70,19 +260,65 @@ class TerminalMusicPlayerApp:
                 self.ui.add_message(f"Error: {e}", error=True)
         
         # Clean up before exit
+        signal.set_wakeup_fd(-1)
+        self.player.close()
+        # Write any edits still waiting for the debounced auto-save
+        self.playlist_manager.flush()
+        if self.song_info_save_timer is not None:
+            self._save_song_info_cache()
+        # Don't wait for in-flight yt-dlp calls; drop anything still queued
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _post_event(self, event_type, event_data):
+        """Queue an event for the main loop and wake it up"""
+        self.event_queue.put((event_type, event_data))
+        self._wake()
+    
+    def _request_redraw(self):
+        """Ask the main loop for a redraw from a background thread"""
+        self.redraw_event.set()
+        self._wake()
+    
+    def _wake(self):
+        """Interrupt the main loop's select()"""
+        try:
+            os.write(self.wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Pipe already full, so the loop is going to wake anyway
+    
+    def _on_terminal_resize(self, signum, frame):
+        """SIGWINCH handler; the actual resize happens on the next loop pass"""
+        self.resize_pending = True
+    
+    def _wait_timeout(self, last_tick, last_render):
+        """How long the main loop may sleep before it has work to do"""
+        now = time.monotonic()
+        timeout = None  # Idle: sleep until a key or an event arrives
         if self.player.is_playing():
-            self.player.stop()
+            timeout = max(0.0, last_tick + PLAYBACK_TICK_INTERVAL - now)
+        if self.redraw_event.is_set():
+            # A rate-limited redraw is still owed
+            pending = max(0.0, last_render + MIN_FRAME_INTERVAL - now)
+            timeout = pending if timeout is None else min(timeout, pending)
+        return timeout
+    
+    def _after_durations_fetched(self, durations):
+        """Apply and report the startup duration refresh"""
+        updated_count = self.playlist_manager.apply_durations(durations)
+        if updated_count:
+            self.ui.add_message(f"Durasi {updated_count} lagu diperbarui")
     
     def _process_events(self):
         """Process all pending events from the event queue"""
-        try:
-            # Process all available events without blocking
-            while not self.event_queue.empty():
+        # Process all available events without blocking
+        while True:
+            try:
                 event_type, event_data = self.event_queue.get_nowait()
-                self._handle_event(event_type, event_data)
-                self.event_queue.task_done()
-        except queue.Empty:
-            pass
+            except queue.Empty:
+                break
+            self._handle_event(event_type, event_data)
+            self.event_queue.task_done()
+            self.redraw_event.set()
     
     def _handle_event(self, event_type, event_data):
         """Handle events from the event queue"""
@@ -101,7 +337,8 @@ class TerminalMusicPlayerApp:
         elif event_type == EVENT_DOWNLOAD_COMPLETED:
             success, song_url, filename, title = event_data
             if success:
-                self.downloaded_songs[song_url] = filename
+                with self.downloads_lock:
+                    self.downloaded_songs[song_url] = filename
                 self.ui.add_message(f"Download berhasil: {title}")
             else:
                 self.ui.add_message(f"Download gagal: {title}", error=True)
@@ -113,12 +350,22 @@ class TerminalMusicPlayerApp:
             
         elif event_type == EVENT_ERROR:
             self.ui.add_message(f"Error: {event_data}", error=True)
+            
+        elif event_type == EVENT_TASK_COMPLETED:
+            callback, result = event_data
+            callback(result)
     
     def _update_ui(self):
         """Update UI based on current state"""
         songs = self.playlist_manager.get_songs()
         
-        if self.player.is_playing() and self.current_index < len(songs):
+        # Read each piece of state once per frame
+        is_playing = self.player.is_playing()
+        shuffle_mode = self.playlist_manager.is_shuffle_mode()
+        auto_download = self.player.is_auto_download()
+        downloaded = len(self.downloaded_songs)
+        
+        if is_playing and self.current_index < len(songs):
             current_song = songs[self.current_index]
             playback_source = "LOKAL" if current_song["url"] in self.downloaded_songs else "STREAM"
             
@@ -126,12 +373,12 @@ class TerminalMusicPlayerApp:
             self.ui.render_playing_state(
                 songs, 
                 self.current_index,
-                self.playlist_manager.is_shuffle_mode(),
+                shuffle_mode,
                 self.player.get_current_time(),
                 current_song,
                 playback_source,
-                self.player.is_auto_download(),
-                len(self.downloaded_songs),
+                auto_download,
+                downloaded,
                 len(songs)
             )
         else:
@@ -139,17 +386,21 @@ class TerminalMusicPlayerApp:
             self.ui.render_idle_state(
                 songs,
                 self.current_index,
-                self.playlist_manager.is_shuffle_mode(),
-                self.player.is_auto_download(),
-                len(self.downloaded_songs),
+                shuffle_mode,
+                auto_download,
+                downloaded,
             )
     
     def _handle_command(self, command):
         """Handle user commands"""
-        songs = self.playlist_manager.get_songs()
+        handler = self.command_handlers.get(command)
+        if handler:
+            handler()
+            return
         
         # Handle numeric input (direct song selection)
         if command.isdigit():
+            songs = self.playlist_manager.get_songs()
             selected_index = int(command) - 1
             if 0 <= selected_index < len(songs):
                 if self.player.is_playing():
@@ -159,31 +410,8 @@ class TerminalMusicPlayerApp:
             else:
                 self.ui.add_message("Nomor lagu tidak valid", error=True)
             return
-            
-        # Handle commands
-        command_handlers = {
-            'q': self._cmd_quit,
-            'p': self._cmd_play,
-            's': self._cmd_stop,
-            'n': self._cmd_next,
-            'prev': self._cmd_prev,
-            'r': self._cmd_toggle_shuffle,
-            'a': self._cmd_add_song,
-            'e': self._cmd_edit_song,
-            'd': self._cmd_delete_song,
-            'i': self._cmd_get_song_info,
-            'save': self._cmd_save_playlist,
-            'dl': self._cmd_download_current,
-            'auto': self._cmd_toggle_auto_download,
-            'dla': self._cmd_download_all,
-            'pause': self._cmd_pause,  # New command for pause/resume
-        }
         
-        handler = command_handlers.get(command)
-        if handler:
-            handler()
-        else:
-            self.ui.add_message(f"Perintah tidak dikenal: {command}", error=True)
+        self.ui.add_message(f"Perintah tidak dikenal: {command}", error=True)
     
     def _cmd_quit(self):
         """Quit the application"""
@@ -249,20 +477,42 @@ class TerminalMusicPlayerApp:
                 self.ui.add_message("Mengambil informasi lagu... Mohon tunggu.")
                 # Use async worker to fetch duration
                 self._run_in_background(
-                    self._fetch_song_info,
+                    self._fetch_new_song_duration,
                     url,
-                    lambda song_info: self._add_song_after_fetch(title, artist, url, song_info)
+                    callback=lambda duration: self._add_song_after_fetch(title, artist, url, duration)
                 )
             else:
                 # Add song directly if duration is provided
-                self.current_index = self.playlist_manager.add_song(title, artist, url, duration)
-                self.ui.add_message(f"Lagu '{title}' berhasil ditambahkan")
+                index, message = self.playlist_manager.add_song(title, artist, url, duration)
+                self._after_song_added(index, message)
     
-    def _add_song_after_fetch(self, title, artist, url, song_info):
+    def _fetch_new_song_duration(self, url):
+        """Background task: the duration for a song about to be added
+        
+        Falls back to the playlist manager's own yt-dlp lookup here, so the
+        main-loop callback never has to spawn yt-dlp itself.
+        """
+        duration = self._fetch_song_info(url).get("duration", "Unknown")
+        if duration == "Unknown":
+            duration = self.playlist_manager.fetch_duration(url)
+        return duration
+    
+    def _add_song_after_fetch(self, title, artist, url, duration):
         """Add song after fetching metadata"""
-        duration = song_info["duration"]
-        self.current_index = self.playlist_manager.add_song(title, artist, url, duration)
-        self.ui.add_message(f"Lagu '{title}' berhasil ditambahkan dengan durasi: {duration}")
+        # Every lookup already ran in the background; don't retry on the main loop
+        index, message = self.playlist_manager.add_song(title, artist, url, duration, fetch_missing=False)
+        if index >= 0:
+            message = f"Lagu '{title}' berhasil ditambahkan dengan durasi: {duration}"
+        self._after_song_added(index, message)
+    
+    def _after_song_added(self, index, message):
+        """Select a newly added song and refresh playlist lookups"""
+        if index < 0:
+            self.ui.add_message(message, error=True)
+            return
+        self.current_index = index
+        self._rebuild_url_index()
+        self.ui.add_message(message)
     
     def _cmd_edit_song(self):
         """Edit the current song"""
@@ -274,6 +524,7 @@ class TerminalMusicPlayerApp:
             song = songs[self.current_index]
             title, artist, url, duration = self.ui.edit_song_form(song)
             success, message = self.playlist_manager.update_song(self.current_index, title, artist, url, duration)
+            self._rebuild_url_index()
             self.ui.add_message(message, error=not success)
         else:
             self.ui.add_message("Tidak ada lagu yang dipilih", error=True)
@@ -288,6 +539,7 @@ class TerminalMusicPlayerApp:
             song = songs[self.current_index]
             if self.ui.confirm_delete(song):
                 success, message = self.playlist_manager.delete_song(self.current_index)
+                self._rebuild_url_index()
                 songs = self.playlist_manager.get_songs()
                 if songs:
                     self.current_index = min(self.current_index, len(songs) - 1)
@@ -297,7 +549,7 @@ class TerminalMusicPlayerApp:
         else:
             self.ui.add_message("Tidak ada lagu yang dipilih", error=True)
     
-    def _cmd_get_song_info(self):
+    def _cmd_get_song_info(self, refresh=False):
         """Get and update song info from the internet"""
         songs = self.playlist_manager.get_songs()
         if songs and self.current_index < len(songs):
@@ -308,11 +560,16 @@ class TerminalMusicPlayerApp:
             self._run_in_background(
                 self._fetch_song_info,
                 url,
-                lambda song_info: self._update_song_info(song_info)
+                refresh,
+                callback=self._update_song_info
             )
         else:
             self.ui.add_message("Tidak ada lagu yang dipilih", error=True)
     
+    def _cmd_refresh_song_info(self):
+        """Get song info, bypassing the metadata cache"""
+        self._cmd_get_song_info(refresh=True)
+    
     def _update_song_info(self, song_info):
         """Update song with fetched info"""
         songs = self.playlist_manager.get_songs()
@@ -328,7 +585,7 @@ class TerminalMusicPlayerApp:
     
     def _cmd_save_playlist(self):
         """Save the playlist to disk"""
-        success, message = self.playlist_manager.save_playlist()
+        success, message = self.playlist_manager.save_playlist(backup=True)
         self.ui.add_message(message, error=not success)
     
     def _cmd_download_current(self):
@@ -337,26 +594,23 @@ class TerminalMusicPlayerApp:
         if songs and self.current_index < len(songs):
             song = songs[self.current_index]
             
-            # Show downloading message
-            self.ui.add_message(f"Mendownload: {song['title']}... Mohon tunggu.")
-            
-            # Download in background
-            self._run_in_background(
-                self._download_song,
+            # Hand the download to the download worker
+            pending = self._queue_download(
                 song["url"],
                 song["title"],
                 lambda result: self._handle_download_result(result, song["url"], song["title"])
             )
+            self.ui.add_message(f"Mendownload: {song['title']}... (antrian: {pending})")
         else:
             self.ui.add_message("Tidak ada lagu yang dipilih", error=True)
     
     def _handle_download_result(self, result, url, title):
         """Handle download completion"""
         success, filename = result
-        self.event_queue.put((
-            EVENT_DOWNLOAD_COMPLETED, 
+        self._post_event(
+            EVENT_DOWNLOAD_COMPLETED,
             (success, url, filename, title)
-        ))
+        )
     
     def _cmd_toggle_auto_download(self):
         """Toggle auto-download mode"""
@@ -376,40 +630,42 @@ class TerminalMusicPlayerApp:
         self._run_in_background(
             self._download_all_songs,
             songs,
-            lambda result: self._handle_download_all_result(result)
+            callback=self._handle_download_all_result
         )
     
     def _download_all_songs(self, songs):
         """Background task to download all songs"""
         success_count = 0
-        results = []
+        total = len(songs)
+        # Only report every few completions so large playlists don't flood the UI
+        report_every = max(1, total // 10)
         
-        for i, song in enumerate(songs):
-            # Update progress through event queue
-            self.event_queue.put((
-                EVENT_OPERATION_COMPLETED, 
-                {"message": f"Mendownload [{i+1}/{len(songs)}]: {song['title']}..."}
-            ))
-            
-            # Download song
-            result, filename = self._download_song(song["url"], song["title"])
-            if result:
-                success_count += 1
-                results.append((song["url"], filename))
-            
-            # Small delay to allow UI updates
-            time.sleep(0.1)
+        # Bounded pool so we don't saturate the connection or trip yt-dlp rate limits.
+        # Without the yt_dlp package each download runs in its own yt-dlp process and
+        # the workers just wait on it; with it, downloads run in-process and share the
+        # GIL, but they are mostly network-bound and ffmpeg post-processing is still a
+        # separate process, so a thread pool remains enough.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_ALL_WORKERS) as pool:
+            futures = {pool.submit(self._download_song, song["url"], song["title"]): song for song in songs}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                song = futures[future]
+                success, filename = future.result()
+                if success:
+                    with self.downloads_lock:
+                        self.downloaded_songs[song["url"]] = filename
+                    success_count += 1
+                
+                if done % report_every == 0 or done == total:
+                    self._post_event(
+                        EVENT_OPERATION_COMPLETED,
+                        {"message": f"Mendownload [{done}/{total}]: {song['title']}"}
+                    )
             
-        return success_count, len(songs), results
+        return success_count, total
     
     def _handle_download_all_result(self, result):
         """Handle completion of downloading all songs"""
-        success_count, total_count, download_results = result
-        
-        # Update downloaded_songs dictionary
-        for url, filename in download_results:
-            self.downloaded_songs[url] = filename
-            
+        success_count, total_count = result
         self.ui.add_message(f"Berhasil mendownload {success_count} dari {total_count} lagu")
         
     def _cmd_pause(self):
@@ -440,23 +696,31 @@ class TerminalMusicPlayerApp:
                 self.ui.render_processing_state(f"Mendownload: {song['title']}")
                 
                 # Download in background then play
-                self._run_in_background(
-                    self._download_song,
+                self._queue_download(
                     song_url,
                     song["title"],
-                    lambda result: self._play_after_download(result, index, song)
+                    lambda result: self._play_after_download(result, song)
                 )
             else:
                 # Play directly
                 self._play_now(index, filename)
     
-    def _play_after_download(self, result, index, song):
+    def _play_after_download(self, result, song):
         """Play song after download completes"""
         success, filename = result
         song_url = song["url"]
         
         if success:
-            self.downloaded_songs[song_url] = filename
+            with self.downloads_lock:
+                self.downloaded_songs[song_url] = filename
+        
+        # The playlist may have changed while downloading, so find the song again
+        index = self.url_to_index.get(song_url)
+        if index is None:
+            self.ui.add_message(f"Lagu tidak lagi ada di playlist: {song['title']}", error=True)
+            return
+        
+        if success:
             self._play_now(index, filename)
         else:
             # Fall back to streaming if download fails
@@ -472,7 +736,7 @@ class TerminalMusicPlayerApp:
             
             # Setup callback for when song finishes
             def on_song_complete():
-                self.event_queue.put((EVENT_PLAYBACK_ENDED, index))
+                self._post_event(EVENT_PLAYBACK_ENDED, index)
             
             # Play from local file if available, otherwise stream
             if filename and os.path.exists(filename):
@@ -483,47 +747,96 @@ class TerminalMusicPlayerApp:
                 source = "STREAM"
                 
             if success:
-                self.event_queue.put((
-                    EVENT_PLAYBACK_STARTED, 
+                self._post_event(
+                    EVENT_PLAYBACK_STARTED,
                     {"title": song["title"], "source": source}
-                ))
+                )
             else:
-                self.event_queue.put((EVENT_ERROR, message))
+                self._post_event(EVENT_ERROR, message)
     
     def _download_song(self, url, title):
         """Download a song using yt-dlp"""
         try:
             # Create a safe filename
-            safe_title = "".join([c if c.isalnum() or c in [' ', '-', '_'] else '_' for c in title])
-            filename = f"downloads/{safe_title}.mp3"
+            name = f"{safe_title(title)}.mp3"
+            filename = f"downloads/{name}"
             
-            # Check if file already exists
-            if os.path.exists(filename):
-                return True, filename
+            # Check if file already exists. The set avoids touching the disk
+            # for unknown songs; a hit is confirmed with one stat() so an
+            # empty leftover from an interrupted download is fetched again
+            with self.downloads_lock:
+                known = name in self.present_files
+            if known:
+                try:
+                    if os.stat(filename).st_size > 0:
+                        return True, filename
+                except FileNotFoundError:
+                    pass
+                with self.downloads_lock:
+                    self.present_files.discard(name)
                 
             # Download the song
             result = self.player.download_song(url, filename)
+            if result:
+                with self.downloads_lock:
+                    self.present_files.add(name)
             return result, filename
         except Exception as e:
             return False, None
     
-    def _fetch_song_info(self, url):
-        """Fetch song information from URL"""
-        return self.player.get_song_info(url)
+    def _fetch_song_info(self, url, refresh=False):
+        """Fetch song information from URL, using the on-disk cache when fresh"""
+        key = canonical_url(url)
+        if not refresh:
+            with self.song_info_lock:
+                cached = self.song_info_cache.get(key)
+            if cached and time.time() - cached.get("fetched_at", 0) < SONG_INFO_CACHE_TTL:
+                return cached
+        
+        song_info = self.player.get_song_info(url)
+        if song_info.get("error") or song_info.get("duration") == "Unknown":
+            return song_info
+        
+        entry = {
+            "duration": song_info["duration"],
+            "title": song_info.get("title", "Unknown Title"),
+            "uploader": song_info.get("uploader", "Unknown Artist"),
+            "fetched_at": time.time()
+        }
+        with self.song_info_lock:
+            self.song_info_cache[key] = entry
+        self._schedule_song_info_save()
+        return entry
+    
+    def _queue_download(self, url, title, callback):
+        """Queue a song for the download worker and return the number of pending jobs"""
+        self.download_queue.put((url, title, callback))
+        return self.download_queue.unfinished_tasks
+    
+    def _download_worker(self):
+        """Consume download jobs so downloads never block command handling"""
+        while True:
+            url, title, callback = self.download_queue.get()
+            try:
+                result = self._download_song(url, title)
+                self._post_event(EVENT_TASK_COMPLETED, (callback, result))
+            except Exception as e:
+                self._post_event(EVENT_ERROR, str(e))
+            finally:
+                self.download_queue.task_done()
     
     def _run_in_background(self, task_func, *args, callback=None):
-        """Run a task in background thread with optional callback"""
+        """Run a task on the background pool with optional callback"""
         def _background_task():
             try:
                 result = task_func(*args)
                 if callback:
-                    callback(result)
+                    # Callbacks touch app state, so run them on the main loop
+                    self._post_event(EVENT_TASK_COMPLETED, (callback, result))
             except Exception as e:
-                self.event_queue.put((EVENT_ERROR, str(e)))
+                self._post_event(EVENT_ERROR, str(e))
         
-        thread = threading.Thread(target=_background_task)
-        thread.daemon = True
-        thread.start()
+        self.executor.submit(_background_task)
 
 def main():
     try:
@@ -7,16 +7,106 @@ import os
 import socket
 import tempfile
 import atexit
+import ctypes
+import hashlib
+import itertools
 import logging
+import selectors
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Callable, Union, List, Tuple
 
+# orjson is optional; it is much faster on the IPC event stream
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# With the yt_dlp package available, lookups and downloads run in-process
+# instead of paying for a fresh yt-dlp interpreter on every call
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+class _YtdlpLogger:
+    """Sends yt-dlp's output to our logger at debug level
+    
+    quiet=True still lets yt-dlp write "ERROR: ..." lines to stderr; with
+    a logger set, everything it would print comes here instead. Callers
+    report failures themselves from return codes and exceptions.
+    """
+    def debug(self, msg):
+        logger.debug(f"yt-dlp: {msg}")
+    
+    info = warning = error = debug
+
+# Options for the shared YoutubeDL used by get_song_info
+_INFO_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'noplaylist': True,
+    'skip_download': True,
+    'socket_timeout': 10,
+    'logger': _YtdlpLogger(),
+}
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data):
+    """Decode JSON from bytes or a memoryview over bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+# Size of the reusable buffer the IPC listener reads into
+IPC_RECV_BUFFER_SIZE = 65536
+# Consumed IPC bytes are discarded once a partial line sits past this offset
+IPC_BUFFER_COMPACT_SIZE = 16384
+
+# Properties mpv pushes to us; all change rarely, so they are observed.
+# time-pos changes constantly and is fetched only when the UI asks for it.
+OBSERVED_PROPERTIES = ("duration", "pause", "volume", "media-title")
+# All observe_property commands, sent in a single write after connecting
+_OBSERVE_PAYLOAD = b"".join(
+    _json_dumps({"command": ["observe_property", i, name]}) + b'\n'
+    for i, name in enumerate(OBSERVED_PROPERTIES, start=1)
+)
+
+# inotify lets us sleep until mpv creates its IPC socket (Linux only)
+_IN_CREATE = 0x100
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith('linux') else None
+_HAS_INOTIFY = _libc is not None and hasattr(_libc, 'inotify_init1')
+# How long the listener waits for the socket before rechecking mpv is alive
+SOCKET_WAIT_TIMEOUT = 2.0
+# Upper bound on how long play() waits for the IPC connection to come up
+PLAY_CONNECT_TIMEOUT = 0.5
+
+# get_song_info results are cached on disk, one small JSON file per URL, in
+# the user's own cache directory (created 0700) rather than the shared /tmp
+SONG_INFO_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "musikplayer", "info",
+)
+SONG_INFO_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# "MM:SS" seek targets, optionally signed
+_MMSS_RE = re.compile(r'^([+-]?)(\d+):(\d+)$')
+
+# Worker threads for get_song_info_async / download_song_async
+IO_WORKERS = 4
+
 # Setup basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("MusicPlayer")
 
-@dataclass
+@dataclass(slots=True)
 class PlaybackStatus:
     """Data class to store playback status information"""
     playing: bool = False
@@ -27,13 +117,18 @@ class PlaybackStatus:
     source_path: str = ""
     is_stream: bool = False
     media_title: str = ""
+    # Last formatted position, rebuilt only when the whole second changes
+    _pos_key: int = field(default=-1, init=False, repr=False, compare=False)
+    _pos_str: str = field(default="00:00", init=False, repr=False, compare=False)
     
     @property
     def position_formatted(self) -> str:
         """Return formatted position as MM:SS"""
-        minutes = int(self.position // 60)
-        seconds = int(self.position % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        key = int(self.position)
+        if key != self._pos_key:
+            self._pos_key = key
+            self._pos_str = f"{key // 60:02d}:{key % 60:02d}"
+        return self._pos_str
         
     @property
     def duration_formatted(self) -> str:
@@ -50,11 +145,20 @@ class PlaybackStatus:
         return min(100, max(0, (self.position / self.duration) * 100))
 
 class MusicPlayer:
+    # mpv property name -> (PlaybackStatus field, converter)
+    _PROPERTY_FIELDS = {
+        'time-pos': ('position', float),
+        'duration': ('duration', float),
+        'pause': ('paused', bool),
+        'volume': ('volume', int),
+        'media-title': ('media_title', str),
+    }
+    
     def __init__(self, socket_dir=None):
         """Initialize MusicPlayer with improved IPC communication"""
         self.process = None
         self.is_running = False
-        self.ipc_thread = None
+        self.ipc_thread = None  # long-lived; started by the first play()
         self.auto_next_callback = None
         self.auto_download = False  # Mode auto-download dinonaktifkan secara default
         
@@ -67,6 +171,33 @@ class MusicPlayer:
         # For event callbacks
         self._event_handlers = {}
         
+        # One long-lived IPC connection, opened by the listener thread and
+        # shared for commands; replies are matched back by request_id
+        self._cmd_sock = None
+        self._cmd_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._pending = {}  # request_id -> [threading.Event, response]
+        self._connected = threading.Event()
+        
+        # Each play() starts a new IPC session, served by the one worker
+        # thread; a session ends as soon as a newer one is requested
+        self._session = 0
+        self._session_ready = threading.Event()
+        self._session_idle = threading.Event()
+        self._session_idle.set()
+        
+        # Shared in-process YoutubeDL for info lookups, created on first use
+        self._ydl = None
+        self._ydl_lock = threading.Lock()
+        
+        # Runs lookups and downloads off the caller's thread
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="mp-io")
+        
+        # Self-pipe so stop() can wake the listener out of its select()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        
         # Status tracking
         self.status = PlaybackStatus()
         
@@ -76,94 +207,232 @@ class MusicPlayer:
     def _cleanup(self):
         """Clean up resources when player is destroyed"""
         self.stop()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         try:
             if os.path.exists(self.socket_path):
                 os.unlink(self.socket_path)
         except:
             pass
             
-    def _send_command(self, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _send_command(self, command: Dict[str, Any], timeout: float = 1.0) -> Optional[Dict[str, Any]]:
         """Send command to mpv via IPC socket and get response"""
-        if not self.is_running or not os.path.exists(self.socket_path):
+        sock = self._cmd_sock
+        if not self.is_running or sock is None:
             logger.debug("Cannot send command: player not running or socket not available")
             return None
+        
+        # Any request_id from the caller just means "wait for the reply"; a
+        # unique id is assigned so concurrent commands can't get crossed
+        slot = None
+        if command.get('request_id') is not None:
+            with self._cmd_lock:
+                request_id = next(self._request_ids)
+            command = dict(command, request_id=request_id)
+            slot = [threading.Event(), None]
+            self._pending[request_id] = slot
             
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
-                sock.connect(self.socket_path)
-                sock.sendall(json.dumps(command).encode('utf-8') + b'\n')
-                
-                if command.get('request_id') is not None:
-                    sock.settimeout(1.0)
-                    response = b''
-                    while True:
-                        try:
-                            chunk = sock.recv(4096)
-                            if not chunk:
-                                break
-                            response += chunk
-                            if b'\n' in response:
-                                break
-                        except socket.timeout:
-                            break
-                            
-                    if response:
-                        try:
-                            return json.loads(response)
-                        except json.JSONDecodeError:
-                            logger.warning("Invalid JSON response from mpv")
-                            
-            return None
+            payload = _json_dumps(command) + b'\n'
+            with self._cmd_lock:
+                sock.sendall(payload)
         except Exception as e:
             logger.error(f"Error sending command to mpv: {e}")
+            if slot:
+                self._pending.pop(command['request_id'], None)
             return None
+        
+        if slot is None:
+            return None
+        if not slot[0].wait(timeout):
+            self._pending.pop(command['request_id'], None)
+            return None
+        return slot[1]
+    
+    def _send_command_async(self, command: Dict[str, Any]) -> bool:
+        """Send command to mpv without waiting for a reply; True if it was written"""
+        sock = self._cmd_sock
+        if not self.is_running or sock is None:
+            return False
+        try:
+            payload = _json_dumps(command) + b'\n'
+            with self._cmd_lock:
+                sock.sendall(payload)
+            return True
+        except Exception as e:
+            logger.error(f"Error sending command to mpv: {e}")
+            return False
+    
+    def _dispatch_message(self, message: Dict[str, Any]):
+        """Route a message from mpv to a waiting command or the event handlers"""
+        request_id = message.get('request_id')
+        if request_id is not None and 'event' not in message:
+            slot = self._pending.pop(request_id, None)
+            if slot:
+                slot[1] = message
+                slot[0].set()
+            return
+        self._handle_event(message)
+    
+    def _wake_listener(self):
+        """Interrupt the listener thread's select()"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except BlockingIOError:
+            pass
+    
+    def _wait_for_socket(self, timeout: float) -> bool:
+        """Wait until mpv has created the IPC socket file"""
+        if os.path.exists(self.socket_path):
+            return True
+        deadline = time.monotonic() + timeout
+        
+        inotify_fd = -1
+        if _HAS_INOTIFY:
+            inotify_fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if inotify_fd < 0:
+            # No inotify: fall back to a short polling loop
+            delay = 0.01
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                if os.path.exists(self.socket_path):
+                    return True
+                delay = min(delay * 2, 0.2)
+            return False
+        
+        try:
+            if _libc.inotify_add_watch(inotify_fd, os.fsencode(self.socket_dir), _IN_CREATE) < 0:
+                return False
+            with selectors.DefaultSelector() as selector:
+                selector.register(inotify_fd, selectors.EVENT_READ)
+                # Re-check after adding the watch so a socket created in
+                # between is not missed
+                while not os.path.exists(self.socket_path):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not selector.select(remaining):
+                        return False
+                    try:
+                        os.read(inotify_fd, 4096)
+                    except BlockingIOError:
+                        pass
+            return True
+        finally:
+            os.close(inotify_fd)
+    
+    def _fail_pending(self):
+        """Wake every command still waiting for a reply"""
+        pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[0].set()
             
-    def _ipc_listen_thread(self):
-        """Thread that listens for events from mpv's IPC socket"""
+    def _ipc_worker_loop(self):
+        """Worker thread that serves one IPC session per play() call"""
+        while True:
+            self._session_ready.wait()
+            self._session_ready.clear()
+            try:
+                self._ipc_listen_thread(self._session)
+            finally:
+                self._session_idle.set()
+                
+    def _ipc_listen_thread(self, session: int):
+        """Listen for events from mpv's IPC socket for one play() session"""
         reconnect_delay = 0.1
         max_reconnect_delay = 2.0
         
-        while self.is_running and self.process and self.process.poll() is None:
+        while (self._session == session and self.is_running
+               and self.process and self.process.poll() is None):
             try:
-                if not os.path.exists(self.socket_path):
-                    time.sleep(reconnect_delay)
-                    reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
+                # Sleep until mpv creates the socket instead of polling for it
+                if not self._wait_for_socket(SOCKET_WAIT_TIMEOUT):
                     continue
                     
                 reconnect_delay = 0.1
                 
-                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock, \
+                        selectors.DefaultSelector() as selector:
                     sock.connect(self.socket_path)
-                    sock.settimeout(0.5)
+                    with self._cmd_lock:
+                        sock.sendall(_OBSERVE_PAYLOAD)
+                    self._cmd_sock = sock
+                    self._connected.set()
+                    # Sleep until mpv sends something or stop() wakes us; mpv
+                    # exiting closes the socket, so no timeout polling is needed
+                    selector.register(sock, selectors.EVENT_READ)
+                    selector.register(self._wake_r, selectors.EVENT_READ)
                     
-                    buffer = b''
-                    while self.is_running and self.process and self.process.poll() is None:
+                    # mpv is read into one preallocated buffer and lines are
+                    # scanned in place; consumed bytes are only dropped once
+                    # the buffer is drained or gets large
+                    buffer = bytearray(IPC_RECV_BUFFER_SIZE)
+                    view = memoryview(buffer)
+                    filled = 0
+                    scan = 0
+                    while self.is_running and self._session == session:
                         try:
-                            data = sock.recv(4096)
-                            if not data:
+                            ready = selector.select()
+                            if any(key.fileobj == self._wake_r for key, _ in ready):
+                                try:
+                                    while os.read(self._wake_r, 4096):
+                                        pass
+                                except BlockingIOError:
+                                    pass
+                            if not any(key.fileobj is sock for key, _ in ready):
+                                continue
+                            
+                            if filled == len(buffer):
+                                # One line is bigger than the buffer; grow it
+                                view.release()
+                                buffer.extend(bytes(len(buffer)))
+                                view = memoryview(buffer)
+                            
+                            try:
+                                received = sock.recv_into(view[filled:])
+                            except ConnectionResetError:
+                                # mpv exited with our last command unread
+                                break
+                            if not received:
                                 break
-                                
-                            buffer += data
+                            filled += received
                             
-                            while b'\n' in buffer:
-                                line, buffer = buffer.split(b'\n', 1)
-                                if line:
+                            while True:
+                                end = buffer.find(b'\n', scan, filled)
+                                if end < 0:
+                                    break
+                                if end > scan:
                                     try:
-                                        event = json.loads(line)
-                                        self._handle_event(event)
+                                        # Decoded straight from the buffer; no
+                                        # slice is kept alive past this line
+                                        message = _json_loads(view[scan:end])
+                                        self._dispatch_message(message)
                                     except json.JSONDecodeError:
-                                        logger.warning(f"Invalid JSON from mpv: {line}")
-                        except socket.timeout:
-                            continue
+                                        logger.warning(f"Invalid JSON from mpv: {bytes(buffer[scan:end])}")
+                                scan = end + 1
+                            
+                            if scan == filled:
+                                filled = scan = 0
+                            elif scan > IPC_BUFFER_COMPACT_SIZE or filled == len(buffer):
+                                # Move the partial line to the front
+                                remaining = filled - scan
+                                buffer[:remaining] = buffer[scan:filled]
+                                filled = remaining
+                                scan = 0
                         except Exception as e:
                             logger.error(f"Socket error: {e}")
                             break
+            except ConnectionRefusedError:
+                # Socket file exists but mpv is not accepting (yet, or any more)
+                time.sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
             except Exception as e:
                 logger.error(f"IPC thread error: {e}")
                 time.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
+            finally:
+                self._connected.clear()
+                self._cmd_sock = None
+                self._fail_pending()
                 
-        if self.status.playing and self.auto_next_callback:
+        if self._session == session and self.status.playing and self.auto_next_callback:
             self.status.playing = False
             self.auto_next_callback()
             
@@ -175,19 +444,10 @@ class MusicPlayer:
         event_name = event.get('event')
         
         if event_name == 'property-change':
-            prop = event.get('name')
+            target = self._PROPERTY_FIELDS.get(event.get('name'))
             value = event.get('data')
-            
-            if prop == 'time-pos' and value is not None:
-                self.status.position = float(value)
-            elif prop == 'duration' and value is not None:
-                self.status.duration = float(value)
-            elif prop == 'pause' and value is not None:
-                self.status.paused = bool(value)
-            elif prop == 'volume' and value is not None:
-                self.status.volume = int(value)
-            elif prop == 'media-title' and value is not None:
-                self.status.media_title = str(value)
+            if target and value is not None:
+                setattr(self.status, target[0], target[1](value))
                 
         elif event_name == 'end-file':
             reason = event.get('reason')
@@ -239,36 +499,40 @@ class MusicPlayer:
             command.extend([
                 "--pause=no",
                 "--force-window=no",
-                "--msg-level=all=v",
-                "--idle=yes",
-                "--property-expansion",
-                "--observe-property=1,time-pos",
-                "--observe-property=2,duration",
-                "--observe-property=3,pause",
-                "--observe-property=4,volume",
-                "--observe-property=5,media-title"
+                "--msg-level=all=error",
+                "--idle=yes"
             ])
              
             command.append(url)
+            
+            # A socket left behind by a killed mpv would look ready before
+            # the new one has been created
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
 
             self.process = subprocess.Popen(
                 command,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                stderr=subprocess.DEVNULL
             )
 
-            time.sleep(0.2)
-
             self.is_running = True
             self.status.playing = True
             self.status.paused = False
 
-            self.ipc_thread = threading.Thread(target=self._ipc_listen_thread)
-            self.ipc_thread.daemon = True
-            self.ipc_thread.start()
+            self._connected.clear()
+            self._session += 1
+            self._session_idle.clear()
+            self._session_ready.set()
+            if self.ipc_thread is None:
+                self.ipc_thread = threading.Thread(target=self._ipc_worker_loop, daemon=True)
+                self.ipc_thread.start()
+            
+            # Return as soon as mpv's IPC socket accepts us (usually well
+            # under 50ms) so commands sent right after play() go through
+            self._connected.wait(PLAY_CONNECT_TIMEOUT)
 
             return True, ""
         except FileNotFoundError:
@@ -280,33 +544,35 @@ class MusicPlayer:
     def stop(self):
         """Menghentikan pemutaran lagu"""
         if self.process and self.process.poll() is None:
-            self.is_running = False
             self.status.playing = False
             try:
+                # Ask mpv to quit while the IPC connection is still in use;
+                # closing the socket before mpv has read the command would
+                # reset the connection and drop it
                 self._send_command({"command": ["quit"]})
-                time.sleep(0.1)
-                if self.process.poll() is None:
-                    self.process.communicate(input='q', timeout=0.5)
-            except:
+                self.process.wait(timeout=0.5)
+            except Exception:
                 self.process.terminate()
                 try:
                     self.process.wait(timeout=1)
                 except subprocess.TimeoutExpired:
                     self.process.kill()
+            finally:
+                self.is_running = False
+                self._wake_listener()
 
-        if self.ipc_thread and self.ipc_thread.is_alive():
-            self.ipc_thread.join(0.5)
+        # Let the session finish with the old socket before a new play();
+        # auto-next runs on the worker itself, which must not wait on itself
+        if threading.current_thread() is not self.ipc_thread:
+            self._session_idle.wait(0.5)
 
     def pause(self) -> bool:
         """Pause playback"""
         if not self.is_playing():
             return False
             
-        result = self._send_command({
-            "command": ["set_property", "pause", True],
-            "request_id": 1
-        })
-        success = result and result.get('error') == 'success'
+        # The observed pause property corrects this if mpv disagrees
+        success = self._send_command_async({"command": ["set_property", "pause", True]})
         if success:
             self.status.paused = True
         return success
@@ -316,11 +582,7 @@ class MusicPlayer:
         if not self.is_playing() or not self.status.paused:
             return False
             
-        result = self._send_command({
-            "command": ["set_property", "pause", False],
-            "request_id": 2
-        })
-        success = result and result.get('error') == 'success'
+        success = self._send_command_async({"command": ["set_property", "pause", False]})
         if success:
             self.status.paused = False
         return success
@@ -348,14 +610,15 @@ class MusicPlayer:
             return False
             
         try:
-            if isinstance(position, str) and ':' in position:
-                minutes, seconds = position.split(':')
-                position = int(minutes) * 60 + int(seconds)
+            if isinstance(position, str):
+                match = _MMSS_RE.match(position)
+                if match:
+                    sign, minutes, seconds = match.groups()
+                    position = int(minutes) * 60 + int(seconds)
+                    if sign == '-':
+                        position = -position
             
-            if isinstance(position, (int, float)):
-                position_str = str(position)
-            else:
-                position_str = position
+            position_str = position if isinstance(position, str) else format(position, '.3f')
                 
             result = self._send_command({
                 "command": ["seek", position_str, "absolute"],
@@ -373,11 +636,8 @@ class MusicPlayer:
             
         try:
             volume = max(0, min(100, int(volume)))
-            result = self._send_command({
-                "command": ["set_property", "volume", volume],
-                "request_id": 4
-            })
-            success = result and result.get('error') == 'success'
+            # The observed volume property corrects this if mpv disagrees
+            success = self._send_command_async({"command": ["set_property", "volume", volume]})
             if success:
                 self.status.volume = volume
             return success
@@ -394,36 +654,90 @@ class MusicPlayer:
             logger.error(f"Error adjusting volume: {e}")
             return False
 
+    def _song_info_cache_path(self, url):
+        """Return the cache file path for url"""
+        key = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(SONG_INFO_CACHE_DIR, f"{key}.json")
+        
+    def _read_song_info_cache(self, url):
+        """Return cached info for url, or None if missing or stale"""
+        path = self._song_info_cache_path(url)
+        try:
+            if time.time() - os.stat(path).st_mtime >= SONG_INFO_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+            
+    def _write_song_info_cache(self, url, info):
+        """Store info for url, replacing the cache file atomically"""
+        path = self._song_info_cache_path(url)
+        try:
+            os.makedirs(SONG_INFO_CACHE_DIR, mode=0o700, exist_ok=True)
+            # Unpredictable temp name, created exclusively
+            fd, tmp_path = tempfile.mkstemp(dir=SONG_INFO_CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(info))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not cache song info: {e}")
+            
+    def _extract_info(self, url):
+        """Return yt-dlp's metadata dict for url, or None on failure"""
+        if yt_dlp is not None:
+            # YoutubeDL is not thread-safe; the lock keeps one lookup at a time
+            with self._ydl_lock:
+                if self._ydl is None:
+                    self._ydl = yt_dlp.YoutubeDL(_INFO_OPTIONS)
+                try:
+                    return self._ydl.extract_info(url, download=False)
+                except yt_dlp.utils.DownloadError:
+                    return None
+                    
+        result = subprocess.run(
+            ["yt-dlp", "--dump-json", "--skip-download", "--quiet",
+             "--no-warnings", "--no-playlist", "--socket-timeout", "10", url],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=15
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
+        
     def get_song_info(self, url):
         """Mendapatkan info lagu dari URL (memerlukan yt-dlp)"""
-        try:
-            result = subprocess.run(
-                ["yt-dlp", "--dump-json", "--no-warnings", "--no-playlist", url],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                timeout=15
-            )
+        cached = self._read_song_info_cache(url)
+        if cached is not None:
+            return cached
             
-            if result.returncode != 0:
+        try:
+            info = self._extract_info(url)
+            if info is None:
                 return {
                     "duration": "Unknown",
                     "title": "Unknown Title",
                     "uploader": "Unknown Artist"
                 }
-                
-            info = json.loads(result.stdout)
 
-            duration_seconds = int(info.get("duration", 0))
+            duration_seconds = int(info.get("duration") or 0)
             minutes = duration_seconds // 60
             seconds = duration_seconds % 60
             duration = f"{minutes:02d}:{seconds:02d}"
 
-            return {
+            song_info = {
                 "duration": duration,
                 "title": info.get("title", "Unknown Title"),
                 "uploader": info.get("uploader", "Unknown Artist")
             }
+            self._write_song_info_cache(url, song_info)
+            return song_info
         except Exception as e:
             logger.error(f"Error getting song info: {e}")
             return {
@@ -447,6 +761,9 @@ class MusicPlayer:
                 "--no-continue",
                 url
             ]
+            
+            if yt_dlp is not None:
+                return self._download_in_process(command[1:], output_file)
              
             result = subprocess.run(
                 command,
@@ -465,8 +782,41 @@ class MusicPlayer:
             logger.error(f"Download error: {str(e)}")
             return False
 
+    def get_song_info_async(self, url) -> Future:
+        """Run get_song_info in the background; the Future yields its dict"""
+        return self._io_pool.submit(self.get_song_info, url)
+        
+    def download_song_async(self, url, output_file) -> Future:
+        """Run download_song in the background; the Future yields its bool"""
+        return self._io_pool.submit(self.download_song, url, output_file)
+
+    def _download_in_process(self, args, output_file):
+        """Run a yt-dlp command line through the yt_dlp library"""
+        # Parse the same arguments the CLI would get so both paths behave alike
+        parsed = yt_dlp.parse_options(args)
+        options = dict(parsed.ydl_opts)
+        options.update(quiet=True, noprogress=True, no_warnings=True, logger=_YtdlpLogger())
+        
+        # One YoutubeDL per call keeps concurrent downloads independent
+        with yt_dlp.YoutubeDL(options) as ydl:
+            return_code = ydl.download(parsed.urls)
+            
+        if return_code == 0 and os.path.exists(output_file):
+            return True
+        logger.error(f"Download error: yt-dlp exited with {return_code}")
+        return False
+
+    def _refresh_position(self):
+        """Fetch time-pos from mpv on demand instead of observing it"""
+        if not self.is_playing():
+            return
+        reply = self._send_command({"command": ["get_property", "time-pos"], "request_id": 0})
+        if reply and reply.get('error') == 'success' and reply.get('data') is not None:
+            self.status.position = float(reply['data'])
+    
     def get_current_time(self):
         """Mendapatkan waktu pemutaran saat ini"""
+        self._refresh_position()
         return self.status.position_formatted
          
     def get_duration(self):
@@ -475,6 +825,7 @@ class MusicPlayer:
          
     def get_progress_percentage(self):
         """Get playback progress as percentage (0-100)"""
+        self._refresh_position()
         return self.status.progress_percentage
          
     def get_volume(self):
@@ -2,14 +2,126 @@ import subprocess
 import json
 import time
 import threading
-import re
 import os
 import socket
 import tempfile
 import random
-from queue import Queue, Empty
+import itertools
+import functools
+import selectors
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
 from typing import Optional, Dict, Any, List, Callable, Tuple
 
+# When the yt-dlp package is importable, downloads run in-process instead of
+# paying for a fresh yt-dlp interpreter per song
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+# orjson is optional; it parses mpv's event stream several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(raw):
+    """Parse one JSON line from bytes or a memoryview; raises json.JSONDecodeError on bad input"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+class _SilentLogger:
+    """yt-dlp logger that drops everything
+    
+    quiet=True does not stop yt-dlp from writing "ERROR: ..." lines to
+    stderr, which would land on top of the curses UI; with a logger set,
+    all of its output goes here instead. Failures still reach the caller
+    through return codes and exceptions.
+    """
+    def debug(self, msg):
+        pass
+    
+    info = warning = error = debug
+
+# Options for the shared YoutubeDL used by get_song_info
+INFO_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'noplaylist': True,
+    'skip_download': True,
+    # An unavailable URL would otherwise print an ERROR line over the UI
+    # before extract_info raises DownloadError
+    'logger': _SilentLogger(),
+}
+
+# Size of the reusable buffer the IPC monitor reads into
+IPC_RECV_BUFFER_SIZE = 65536
+
+# is_playing() re-checks that mpv is alive at most this often (seconds)
+PROCESS_POLL_INTERVAL = 0.5
+
+# Worker threads for get_song_info_async / download_song_async
+IO_WORKERS = 4
+
+# How long play() keeps trying to reach mpv's IPC socket
+IPC_CONNECT_TIMEOUT = 5.0
+
+# Properties mpv pushes to us, observed under ids 1..n
+OBSERVED_PROPERTIES = (
+    "time-pos", "duration", "percent-pos", "metadata", "volume",
+    "audio-bitrate", "demuxer-cache-state",
+)
+# Every subscription, encoded once at import and sent in a single write
+SUBSCRIBE_PAYLOAD = b"".join(
+    json.dumps(command).encode('utf-8') + b'\n'
+    for command in [
+        *({"command": ["observe_property", i, name]}
+          for i, name in enumerate(OBSERVED_PROPERTIES, start=1)),
+        {"command": ["request_event", "end-file", True]},
+    ]
+)
+
+# yt-dlp prints download progress as "progress: 50.0%" lines; the leading
+# "download:" in the template selects the download stage, it is not printed
+PROGRESS_PREFIX = "progress:"
+PROGRESS_TEMPLATE = "download:" + PROGRESS_PREFIX + "%(progress._percent_str)s"
+# The same prefix as matched against yt-dlp's raw (undecoded) output
+PROGRESS_PREFIX_BYTES = PROGRESS_PREFIX.encode('ascii')
+
+# numpy is optional; it generates a visualizer frame in one call
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Visualizer mode -> (lowest value, highest value, number of values)
+VISUALIZER_SHAPES = {
+    "spectrum": (0, 15, 32),
+    "wave": (-7, 7, 60),
+    "bars": (0, 10, 16),
+}
+
+# yt-dlp download tuning: number of fragments fetched concurrently and the
+# size of each HTTP range request for non-fragmented streams
+DOWNLOAD_CONCURRENT_FRAGMENTS = 8
+DOWNLOAD_HTTP_CHUNK_SIZE = "10M"
+
+@dataclass(slots=True)
+class PlaybackStats:
+    """Latest values pushed by mpv; slots keep the per-event writes cheap"""
+    position: float = 0.0
+    duration: float = 0.0
+    percent_pos: float = 0.0
+    cache_used: float = 0.0
+    cache_size: float = 0.0
+    bitrate: int = 0
+    volume: float = 100.0
+    metadata: dict = field(default_factory=dict)
+    filename: str = ""
+    path: str = ""
+
 class MusicPlayer:
     """
     Enhanced Music Player with advanced controls and features
@@ -23,34 +135,51 @@ class MusicPlayer:
         self.process = None
         self.current_time = "00:00"
         self.duration = "00:00"
+        self.last_position_second = -1  # Whole second current_time was built from
         self.volume = 100
         self.is_running = False
+        self.process_alive = False  # Last process.poll() result, see is_playing()
+        self.last_process_poll = 0.0
         self.is_paused = False
         self.socket_path = None
         self.ipc_socket = None
-        self.command_queue = Queue()
-        self.response_queue = Queue()
+        self.send_lock = threading.Lock()  # Serializes writes to ipc_socket
+        self.request_ids = itertools.count(1)
         self.monitor_thread = None
-        self.command_thread = None
-        self.request_id = 1
+        # Self-pipe so stop() can wake the monitor out of select()
+        self.wake_r, self.wake_w = os.pipe()
+        os.set_blocking(self.wake_r, False)
+        os.set_blocking(self.wake_w, False)
         self.auto_next_callback = None
         self.auto_download = False
+        self.ready_dirs = set()  # Download directories already created
+        self.ydl = None  # Shared in-process YoutubeDL for info lookups
+        self.ydl_lock = threading.Lock()
+        # Runs lookups and downloads off the caller's thread; the executor
+        # only starts threads once something is submitted
+        self.io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="player-io")
         self.visualizer_enabled = False
         self.visualizer_mode = "spectrum"  # spectrum, wave, or bars
         self.visualizer_data = []
         self.visualizer_thread = None
+        self.rng = np.random.default_rng() if np is not None else None
         self.event_handlers = {}
-        self.playback_stats = {
-            "position": 0.0,
-            "duration": 0.0,
-            "percent_pos": 0.0,
-            "cache_used": 0.0,
-            "cache_size": 0.0,
-            "bitrate": 0,
-            "volume": 100.0,
-            "metadata": {},
-            "filename": "",
-            "path": ""
+        self.playback_stats = PlaybackStats()
+        
+        # mpv event name -> handler(response)
+        self.event_dispatch = {
+            'end-file': self._on_end_file,
+            'property-change': self._on_property_change,
+        }
+        # Observed property -> handler(value); only called for non-null values
+        self.property_dispatch = {
+            'time-pos': self._on_time_pos,
+            'duration': self._on_duration,
+            'volume': self._on_volume,
+            'percent-pos': functools.partial(self._update_stat, 'percent_pos'),
+            'metadata': functools.partial(self._update_stat, 'metadata'),
+            'audio-bitrate': functools.partial(self._update_stat, 'bitrate'),
+            'demuxer-cache-state': self._on_cache_state,
         }
 
     def play(self, url, auto_next_callback=None, local=False):
@@ -74,7 +203,8 @@ class MusicPlayer:
                 "--cache-secs=30",      # Cache 30 seconds ahead
                 "--demuxer-readahead-secs=5",  # Read 5 seconds ahead
                 "--keep-open=always",   # Keep mpv running after EOF
-                "--force-window=no"     # No visible window
+                "--force-window=no",    # No visible window
+                "--really-quiet"        # Output goes to DEVNULL; skip producing it
             ]
             
             if not local:
@@ -90,45 +220,31 @@ class MusicPlayer:
             self.process = subprocess.Popen(
                 command,
                 stdout=subprocess.DEVNULL,  # Don't need to parse stdout anymore
-                stderr=subprocess.PIPE,     # Only capture stderr for error logging
-                text=True
+                stderr=subprocess.DEVNULL   # Never read; a full pipe would stall mpv
             )
             
-            # Wait for socket to be available
-            retry_count = 0
-            while not os.path.exists(self.socket_path) and retry_count < 50:
-                time.sleep(0.1)
-                retry_count += 1
-                
-            if not os.path.exists(self.socket_path):
+            # Connect to the IPC socket as soon as mpv has created it
+            self.ipc_socket = self._connect_ipc()
+            if self.ipc_socket is None:
                 return False, "Failed to establish IPC connection with MPV"
-                
-            # Connect to the IPC socket
-            self.ipc_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.ipc_socket.connect(self.socket_path)
-            self.ipc_socket.settimeout(0.5)  # Short timeout for responsive UI
             
             # Set initial state
             self.is_running = True
+            self.process_alive = True
+            self.last_process_poll = time.monotonic()
             self.is_paused = False
             self.current_time = "00:00"
-            
-            # Start command thread to handle sending commands
-            self.command_thread = threading.Thread(target=self._command_handler)
-            self.command_thread.daemon = True
-            self.command_thread.start()
+            self.last_position_second = 0
             
             # Start monitor thread to receive responses
             self.monitor_thread = threading.Thread(target=self._monitor_playback)
             self.monitor_thread.daemon = True
             self.monitor_thread.start()
             
-            # Subscribe to important events
+            # Subscribe to important events; mpv answers each observe with
+            # the current value, so no initial fetch is needed
             self._subscribe_to_events()
             
-            # Start fetching initial playback data
-            self._update_playback_stats()
-            
             # Start visualizer if enabled
             if self.visualizer_enabled:
                 self._start_visualizer()
@@ -140,76 +256,99 @@ class MusicPlayer:
         except Exception as e:
             return False, f"Error playing audio: {e}"
 
-    def _command_handler(self):
-        """Thread to handle sending commands to MPV"""
-        while self.is_running and self.ipc_socket:
+    def _connect_ipc(self):
+        """Connect to mpv's IPC socket, retrying while mpv starts up"""
+        deadline = time.monotonic() + IPC_CONNECT_TIMEOUT
+        delay = 0.005
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             try:
-                # Get command from queue or wait for 0.1 seconds
-                try:
-                    command, callback = self.command_queue.get(timeout=0.1)
-                    
-                    # Send command to MPV
-                    command_json = json.dumps(command) + "\n"
-                    self.ipc_socket.sendall(command_json.encode('utf-8'))
-                    
-                    # Store callback if provided
-                    if callback:
-                        self.event_handlers[command.get('request_id', 0)] = callback
-                        
-                    self.command_queue.task_done()
-                except Empty:
-                    # No command in queue, continue loop
-                    continue
-                    
-            except Exception as e:
-                # Log error and continue
-                print(f"Command handler error: {e}")
-                time.sleep(0.1)
+                sock.connect(self.socket_path)
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+            # Give up early if mpv died (bad URL, missing audio device, ...)
+            if self.process.poll() is not None or time.monotonic() >= deadline:
+                return None
+            # Short first retries: the socket usually appears within ~20ms
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+            
+    def _wake_monitor(self):
+        """Interrupt the monitor thread's select()"""
+        try:
+            os.write(self.wake_w, b'\0')
+        except BlockingIOError:
+            pass
                 
     def _monitor_playback(self):
         """Thread to monitor MPV responses and events"""
-        buffer = ""
+        # mpv is read into one preallocated buffer and lines are parsed in
+        # place; only a trailing partial line is ever moved
+        buffer = bytearray(IPC_RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
+        filled = 0
+        sock = self.ipc_socket
+        
+        # One thread sleeps on the mpv socket and the wake pipe together;
+        # every stat is pushed by mpv, so there is nothing to poll
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        selector.register(self.wake_r, selectors.EVENT_READ)
         
         while self.is_running and self.ipc_socket:
             try:
-                # Receive data from socket
-                try:
-                    data = self.ipc_socket.recv(4096).decode('utf-8')
-                    if not data:
+                for key, _ in selector.select():
+                    if key.fileobj is self.wake_r:
+                        try:
+                            while os.read(self.wake_r, 4096):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        continue
+                        
+                    if filled == len(buffer):
+                        # One line is bigger than the buffer; grow it
+                        view.release()
+                        buffer.extend(bytes(len(buffer)))
+                        view = memoryview(buffer)
+                        
+                    # Receive data from socket
+                    received = sock.recv_into(view[filled:])
+                    if not received:
                         # Connection closed
                         if self.is_running:
                             self.stop()
                         break
-                        
-                    # Add data to buffer
-                    buffer += data
+                    filled += received
                     
                     # Process complete JSON objects
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
+                    start = 0
+                    while True:
+                        end = buffer.find(b'\n', start, filled)
+                        if end < 0:
+                            break
                         try:
-                            response = json.loads(line)
+                            response = _loads(view[start:end])
                             self._handle_mpv_response(response)
                         except json.JSONDecodeError:
                             # Invalid JSON, discard
                             pass
-                            
-                except socket.timeout:
-                    # Socket timeout, continue loop
-                    continue
-                    
-                # Check playback status periodically
-                if self.is_running and not self.is_paused:
-                    self._update_playback_stats()
-                    
-                # Short sleep to prevent CPU hogging
-                time.sleep(0.05)
+                        start = end + 1
+                        
+                    # Move the partial line, if any, to the front
+                    if start:
+                        buffer[:filled - start] = view[start:filled]
+                        filled -= start
                 
             except Exception as e:
                 # Log error and continue
                 print(f"Monitor error: {e}")
                 time.sleep(0.1)
                 
+        view.release()
+        selector.close()
+                
         # Clean up when monitoring stops
         if self.auto_next_callback and self.is_running:
             self.is_running = False
@@ -218,45 +357,12 @@ class MusicPlayer:
     def _handle_mpv_response(self, response):
         """Handle responses from MPV"""
         # Handle event messages
-        if 'event' in response:
-            event_name = response['event']
-            
-            # Handle end-file event
-            if event_name == 'end-file':
-                reason = response.get('reason', '')
-                # Only trigger auto-next if playback ended naturally (not by user)
-                if reason == 'eof' and self.auto_next_callback and self.is_running:
-                    self.auto_next_callback()
-                    
-            # Handle property changes
-            elif event_name == 'property-change':
-                prop = response.get('name', '')
-                value = response.get('data')
+        event_name = response.get('event')
+        if event_name is not None:
+            handler = self.event_dispatch.get(event_name)
+            if handler:
+                handler(response)
                 
-                if prop == 'time-pos' and value is not None:
-                    # Update current position
-                    self.playback_stats['position'] = value
-                    minutes = int(value) // 60
-                    seconds = int(value) % 60
-                    self.current_time = f"{minutes:02d}:{seconds:02d}"
-                    
-                elif prop == 'duration' and value is not None:
-                    # Update duration
-                    self.playback_stats['duration'] = value
-                    minutes = int(value) // 60
-                    seconds = int(value) % 60
-                    self.duration = f"{minutes:02d}:{seconds:02d}"
-                    
-                elif prop == 'percent-pos' and value is not None:
-                    self.playback_stats['percent_pos'] = value
-                    
-                elif prop == 'metadata' and value is not None:
-                    self.playback_stats['metadata'] = value
-                    
-                elif prop == 'volume' and value is not None:
-                    self.playback_stats['volume'] = value
-                    self.volume = int(value)
-                    
         # Handle command responses
         elif 'request_id' in response:
             request_id = response['request_id']
@@ -265,76 +371,94 @@ class MusicPlayer:
             if request_id in self.event_handlers:
                 callback = self.event_handlers.pop(request_id)
                 callback(response)
+                
+    def _on_end_file(self, response):
+        """Trigger auto-next if playback ended naturally (not by user)"""
+        if response.get('reason', '') == 'eof' and self.auto_next_callback and self.is_running:
+            self.auto_next_callback()
+            
+    def _on_property_change(self, response):
+        """Route an observed property's new value to its handler"""
+        value = response.get('data')
+        if value is None:
+            return
+        handler = self.property_dispatch.get(response.get('name'))
+        if handler:
+            handler(value)
+            
+    def _on_time_pos(self, value):
+        """Update current position"""
+        self.playback_stats.position = value
+        # mpv reports several times a second; only reformat when the
+        # displayed second changes
+        second = int(value)
+        if second != self.last_position_second:
+            self.last_position_second = second
+            self.current_time = f"{second // 60:02d}:{second % 60:02d}"
+            
+    def _on_duration(self, value):
+        """Update duration"""
+        self.playback_stats.duration = value
+        second = int(value)
+        self.duration = f"{second // 60:02d}:{second % 60:02d}"
+        
+    def _on_cache_state(self, value):
+        """Update both cache stats (in KiB) from one demuxer-cache-state push"""
+        self.playback_stats.cache_used = value.get('fw-bytes', 0) / 1024
+        self.playback_stats.cache_size = value.get('total-bytes', 0) / 1024
+        
+    def _on_volume(self, value):
+        """Update volume"""
+        self.playback_stats.volume = value
+        self.volume = int(value)
 
     def _subscribe_to_events(self):
         """Subscribe to MPV events and property changes"""
-        # Subscribe to end-file event
-        self._send_command({
-            "command": ["observe_property", 1, "time-pos"]
-        })
-        
-        self._send_command({
-            "command": ["observe_property", 2, "duration"]
-        })
-        
-        self._send_command({
-            "command": ["observe_property", 3, "percent-pos"]
-        })
-        
-        self._send_command({
-            "command": ["observe_property", 4, "metadata"]
-        })
-        
-        self._send_command({
-            "command": ["observe_property", 5, "volume"]
-        })
-        
-        # Enable events
-        self._send_command({
-            "command": ["request_event", "end-file", True]
-        })
+        self._send_raw(SUBSCRIBE_PAYLOAD)
 
     def _send_command(self, command, callback=None):
         """Send command to MPV"""
+        self._send_commands([command], [callback])
+        
+    def _send_commands(self, commands, callbacks=None):
+        """Send several commands to MPV with one write"""
         if not self.is_running or not self.ipc_socket:
             return
             
-        # Add request ID if not present
-        if 'request_id' not in command:
-            command['request_id'] = self.request_id
-            self.request_id += 1
-            
-        # Add to command queue
-        self.command_queue.put((command, callback))
-        
-    def _update_playback_stats(self):
-        """Update playback statistics"""
-        if not self.is_running:
-            return
+        payload = bytearray()
+        request_ids = []
+        for command, callback in zip(commands, callbacks or [None] * len(commands)):
+            # Add request ID if not present
+            if 'request_id' not in command:
+                command['request_id'] = next(self.request_ids)
+                
+            # Register the callback before mpv can possibly answer
+            if callback:
+                self.event_handlers[command['request_id']] = callback
+                request_ids.append(command['request_id'])
+                
+            payload += json.dumps(command).encode('utf-8')
+            payload.append(0x0a)
             
-        # Get current playback position
-        self._send_command({
-            "command": ["get_property", "time-pos"]
-        })
-        
-        # Get audio stats
-        self._send_command({
-            "command": ["get_property", "audio-bitrate"]
-        }, lambda resp: self._update_stat('bitrate', resp.get('data')))
-        
-        # Get cache stats
-        self._send_command({
-            "command": ["get_property", "cache-used"]
-        }, lambda resp: self._update_stat('cache_used', resp.get('data')))
+        if not self._send_raw(payload):
+            for request_id in request_ids:
+                self.event_handlers.pop(request_id, None)
+                
+    def _send_raw(self, payload):
+        """Write already-encoded command lines to MPV; True on success"""
+        # Writes are small, so they go straight out on the caller's thread
+        try:
+            with self.send_lock:
+                self.ipc_socket.sendall(payload)
+            return True
+        except (OSError, AttributeError):
+            # Socket closed underneath us by stop()
+            return False
         
-        self._send_command({
-            "command": ["get_property", "cache-size"]
-        }, lambda resp: self._update_stat('cache_size', resp.get('data')))
-
     def _update_stat(self, stat_name, value):
         """Update a specific playback stat"""
         if value is not None:
-            self.playback_stats[stat_name] = value
+            setattr(self.playback_stats, stat_name, value)
 
     def pause(self):
         """Toggle pause/resume playback"""
@@ -378,10 +502,22 @@ class MusicPlayer:
         """Adjust volume by delta"""
         return self.set_volume(self.volume + delta)
 
+    def close(self):
+        """Stop playback and release the I/O pool; the player is done after this
+        
+        stop() only ends the current song and can be followed by play(), so
+        the pool is shut down here rather than there.
+        """
+        if self.is_playing():
+            self.stop()
+        # Don't wait for in-flight yt-dlp calls; drop anything still queued
+        self.io_pool.shutdown(wait=False, cancel_futures=True)
+    
     def stop(self):
         """Stop playback"""
         # Set flags to stop threads
         self.is_running = False
+        self._wake_monitor()
         
         # Stop visualizer if running
         if self.visualizer_thread and self.visualizer_thread.is_alive():
@@ -421,13 +557,6 @@ class MusicPlayer:
             except:
                 pass
                 
-        # Wait for command thread to finish
-        if self.command_thread and self.command_thread.is_alive():
-            try:
-                self.command_thread.join(0.5)
-            except:
-                pass
-                
         # Remove socket file
         if self.socket_path and os.path.exists(self.socket_path):
             try:
@@ -437,33 +566,48 @@ class MusicPlayer:
                 
         # Reset state
         self.current_time = "00:00"
+        self.last_position_second = 0
         self.duration = "00:00"
         self.volume = 100
         self.is_paused = False
 
+    def _extract_info(self, url):
+        """Return yt-dlp's metadata dict for url, or None on failure"""
+        if yt_dlp is not None:
+            # YoutubeDL is not thread-safe; the lock keeps one lookup at a time
+            with self.ydl_lock:
+                if self.ydl is None:
+                    self.ydl = yt_dlp.YoutubeDL(INFO_OPTIONS)
+                try:
+                    return self.ydl.extract_info(url, download=False)
+                except yt_dlp.utils.DownloadError:
+                    return None
+                    
+        result = subprocess.run(
+            ["yt-dlp", "--dump-json", "--no-warnings", "--skip-download", "--no-playlist", url],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=15  # Add timeout to prevent hanging
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
+        
     def get_song_info(self, url):
         """Get song info from URL using yt-dlp"""
         try:
-            result = subprocess.run(
-                ["yt-dlp", "--dump-json", "--no-warnings", "--no-simulate", url],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                timeout=15  # Add timeout to prevent hanging
-            )
-            
-            if result.returncode != 0:
+            info = self._extract_info(url)
+            if info is None:
                 return {
                     "duration": "Unknown",
                     "title": "Unknown Title",
                     "uploader": "Unknown Artist",
                     "error": True
                 }
-                
-            info = json.loads(result.stdout)
             
             # Extract duration
-            duration_seconds = int(info.get("duration", 0))
+            duration_seconds = int(info.get("duration") or 0)
             minutes = duration_seconds // 60
             seconds = duration_seconds % 60
             duration = f"{minutes:02d}:{seconds:02d}"
@@ -501,12 +645,15 @@ class MusicPlayer:
     def download_song(self, url, output_file, progress_callback=None):
         """Download song using yt-dlp with progress updates"""
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+            # Create directory if it doesn't exist (once per directory)
+            output_dir = os.path.dirname(os.path.abspath(output_file))
+            if output_dir not in self.ready_dirs:
+                os.makedirs(output_dir, exist_ok=True)
+                self.ready_dirs.add(output_dir)
             
             # Prepare command
             command = [
-                "yt-dlp", 
+                "yt-dlp",
                 "-x",                         # Extract audio
                 "--audio-format", "mp3",      # Convert to mp3
                 "--audio-quality", "0",       # Best quality
@@ -515,31 +662,34 @@ class MusicPlayer:
                 "--embed-thumbnail",          # Embed thumbnail
                 "--no-playlist",              # Don't download playlist
                 "--no-overwrites",            # Don't overwrite existing files
+                "--concurrent-fragments", str(DOWNLOAD_CONCURRENT_FRAGMENTS),  # Fetch fragments in parallel
+                "--http-chunk-size", DOWNLOAD_HTTP_CHUNK_SIZE,  # Ranged requests avoid per-connection throttling
+                "--quiet",                    # Only errors and the progress below
                 "--progress",                 # Show progress
+                "--newline",                  # One progress line per update
+                "--progress-template", PROGRESS_TEMPLATE,  # Just the percentage
                 url                           # URL to download
             ]
             
+            if yt_dlp is not None:
+                return self._download_in_process(command[1:], output_file, progress_callback)
+            
             # Start process
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                stderr=subprocess.STDOUT
             )
             
-            # Process output for progress updates
+            # Process output for progress updates; lines stay bytes since
+            # only the ASCII progress lines are ever looked at
             for line in process.stdout:
                 # Parse progress info
-                if progress_callback and "[download]" in line and "%" in line:
+                if progress_callback and line.startswith(PROGRESS_PREFIX_BYTES):
                     try:
-                        # Extract percentage from line like: "[download]  50.0% of 5.20MiB at 500KiB/s ETA 00:05"
-                        percent_match = re.search(r'(\d+\.\d+)%', line)
-                        if percent_match:
-                            progress = float(percent_match.group(1))
-                            progress_callback(progress)
-                    except:
+                        progress = float(line[len(PROGRESS_PREFIX_BYTES):].strip().rstrip(b'%'))
+                        progress_callback(progress)
+                    except ValueError:
                         pass
                         
             # Wait for process to finish
@@ -558,6 +708,40 @@ class MusicPlayer:
             print(f"Download error: {str(e)}")
             return False
 
+    def get_song_info_async(self, url) -> Future:
+        """Run get_song_info in the background; the Future yields its dict"""
+        return self.io_pool.submit(self.get_song_info, url)
+        
+    def download_song_async(self, url, output_file, progress_callback=None) -> Future:
+        """Run download_song in the background; the Future yields its bool"""
+        return self.io_pool.submit(self.download_song, url, output_file, progress_callback)
+
+    def _download_in_process(self, args, output_file, progress_callback=None):
+        """Run a yt-dlp command line through the yt_dlp library"""
+        # Parse the same arguments the CLI would get so both paths behave alike
+        parsed = yt_dlp.parse_options(args)
+        options = dict(parsed.ydl_opts)
+        # Output would land on top of the curses UI; quiet alone still lets
+        # errors through to stderr, the logger swallows those too
+        options.update(quiet=True, noprogress=True, no_warnings=True, logger=_SilentLogger())
+        
+        if progress_callback:
+            def _progress_hook(status):
+                total = status.get("total_bytes") or status.get("total_bytes_estimate")
+                if status.get("status") == "downloading" and total:
+                    progress_callback(100.0 * status.get("downloaded_bytes", 0) / total)
+            options["progress_hooks"] = [_progress_hook]
+        
+        # One YoutubeDL per call keeps concurrent downloads independent
+        with yt_dlp.YoutubeDL(options) as ydl:
+            return_code = ydl.download(parsed.urls)
+        
+        if return_code == 0 and os.path.exists(output_file):
+            if progress_callback:
+                progress_callback(100.0)
+            return True
+        return False
+
     def toggle_visualizer(self):
         """Toggle audio visualizer on/off"""
         self.visualizer_enabled = not self.visualizer_enabled
@@ -611,19 +795,16 @@ class MusicPlayer:
         """Update visualizer data based on current audio"""
         # In a real implementation, this would analyze audio data
         # For this example, we'll generate random data
+        shape = VISUALIZER_SHAPES.get(self.visualizer_mode)
+        if shape is None:
+            return
+        low, high, count = shape
         
-        if self.visualizer_mode == "spectrum":
-            # Generate spectrum data (frequency analysis)
-            # Real implementation would use FFT
-            self.visualizer_data = [random.randint(0, 15) for _ in range(32)]
-            
-        elif self.visualizer_mode == "wave":
-            # Generate waveform data
-            self.visualizer_data = [random.randint(-7, 7) for _ in range(60)]
-            
-        elif self.visualizer_mode == "bars":
-            # Generate bar equalizer data
-            self.visualizer_data = [random.randint(0, 10) for _ in range(16)]
+        if self.rng is not None:
+            # Whole frame in one vectorized call
+            self.visualizer_data = self.rng.integers(low, high + 1, size=count).tolist()
+        else:
+            self.visualizer_data = [random.randint(low, high) for _ in range(count)]
     
     def get_visualizer_data(self):
         """Get current visualizer data"""
@@ -656,7 +837,15 @@ class MusicPlayer:
         
     def is_playing(self):
         """Check if player is playing"""
-        return self.is_running and self.process and self.process.poll() is None
+        if not self.is_running or not self.process:
+            return False
+        # The UI asks every frame; a waitpid() per call is not needed since
+        # mpv exiting also closes the socket and stops the monitor
+        now = time.monotonic()
+        if now - self.last_process_poll >= PROCESS_POLL_INTERVAL:
+            self.process_alive = self.process.poll() is None
+            self.last_process_poll = now
+        return self.process_alive
         
     def is_paused_state(self):
         """Check if player is paused"""
@@ -664,4 +853,4 @@ class MusicPlayer:
         
     def get_playback_stats(self):
         """Get all playback statistics"""
-        return self.playback_stats
+        return asdict(self.playback_stats)
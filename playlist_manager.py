@@ -1,10 +1,82 @@
+import atexit
 import json
 import os
 import random
 import subprocess
 import csv
+import functools
 import re
-from datetime import datetime
+import shutil
+import stat
+import threading
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+# orjson is optional; it serialises the playlist several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; it lets large JSON imports be parsed one song at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numpy is optional; it builds the shuffle order with a C-level permutation
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# JSON imports larger than this are streamed with ijson when it is available
+IMPORT_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Buffer size for the line-by-line M3U/CSV import and export handles; whole
+# JSON documents are read and written in one call and need no extra buffer
+TEXT_FILE_BUFFER_SIZE = 1 << 20
+
+# yt-dlp flags shared by the duration lookups: metadata only, no playlist
+# expansion (--flat-playlist stops a playlist URL resolving every entry), and
+# a socket timeout so one stalled host cannot hold a lookup open
+DURATION_FETCH_ARGS = ["--skip-download", "--no-playlist", "--flat-playlist",
+                       "--no-warnings", "--socket-timeout", "5"]
+
+# Edits are written to disk at most once per this many seconds
+SAVE_DEBOUNCE_DELAY = 2.0
+
+# Parsed playlist files by absolute path -> ((mtime_ns, size), songs); a
+# file that has not changed since it was last read or written is not reparsed
+_PLAYLIST_CACHE = {}
+
+# Permissions for a playlist file that does not exist yet, as open() would
+# create it; temp files start at 0600. Read at import, before any threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# Duration format accepted from user input (MM:SS)
+_DURATION_RE = re.compile(r'^\d{1,2}:\d{2}$')
+
+# Shared empty result for validate_song_data's happy path
+_NO_ERRORS = ()
+
+def _dump_json(data, pretty=True):
+    """Serialise data to UTF-8 JSON bytes, indented unless pretty is False"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _load_json(raw):
+    """Parse JSON bytes; raises json.JSONDecodeError on bad input"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 class PlaylistManager:
     def __init__(self, playlist_file="playlist.json"):
@@ -13,16 +85,37 @@ class PlaylistManager:
         self.shuffle_mode = False
         self.shuffle_history = []
         self.shuffle_index = 0
+        # Lower-cased copies of each song's fields for search_songs; rebuilt
+        # on the next search after any edit (every edit calls schedule_save)
+        self._lowercase_index = []
+        self._index_dirty = True
         
         # Load playlist on initialization
         self.songs = self.load_playlist()
+        
+        # Auto-saves are coalesced by a background flusher thread
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._dirty_event = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        # The flusher is a daemon thread; write anything still pending on exit
+        atexit.register(self.flush)
     
     def load_playlist(self):
         """Memuat playlist dari file JSON"""
         try:
             if os.path.exists(self.playlist_file):
-                with open(self.playlist_file, 'r', encoding='utf-8') as file:
-                    return json.load(file)
+                path = os.path.abspath(self.playlist_file)
+                st = os.stat(path)
+                cached = _PLAYLIST_CACHE.get(path)
+                if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+                    # Copies, so edits here never leak into the cache
+                    return [dict(song) for song in cached[1]]
+                with open(path, 'rb') as file:
+                    songs = _load_json(file.read())
+                _PLAYLIST_CACHE[path] = ((st.st_mtime_ns, st.st_size), [dict(song) for song in songs])
+                return songs
             else:
                 print("File playlist.json tidak ditemukan. Menggunakan playlist default.")
                 return self.get_default_playlist()
@@ -58,28 +151,35 @@ class PlaylistManager:
     
     def validate_song_data(self, title, artist, url, duration):
         """Validasi data lagu"""
+        title_ok = isinstance(title, str) and title
+        url_ok = isinstance(url, str) and url.startswith(("http://", "https://"))
+        duration_ok = not duration or duration == "Unknown" or _DURATION_RE.match(duration)
+        if title_ok and url_ok and duration_ok:
+            # Valid input is the common case; only build a list on failure
+            return _NO_ERRORS
+        
         errors = []
         
-        if not title or not isinstance(title, str):
+        if not title_ok:
             errors.append("Judul lagu tidak valid")
         
         if not url or not isinstance(url, str):
             errors.append("URL lagu tidak valid")
-        elif not (url.startswith("http://") or url.startswith("https://")):
+        elif not url.startswith(("http://", "https://")):
             errors.append("URL harus dimulai dengan http:// atau https://")
             
         # Validate duration format if provided
-        if duration and duration != "Unknown":
-            if not re.match(r'^\d{1,2}:\d{2}$', duration):
-                errors.append("Format durasi harus MM:SS")
+        if not duration_ok:
+            errors.append("Format durasi harus MM:SS")
         
         return errors
     
     def fetch_duration(self, url):
         """Mengambil durasi lagu dari URL menggunakan yt-dlp"""
         try:
+            # Print only the duration instead of dumping the whole metadata JSON
             result = subprocess.run(
-                ["yt-dlp", "--dump-json", "--no-warnings", url],
+                ["yt-dlp", "--print", "%(duration)s", *DURATION_FETCH_ARGS, url],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
                 text=True,
@@ -88,57 +188,152 @@ class PlaylistManager:
             
             if result.returncode != 0:
                 return "Unknown"
-                
-            info = json.loads(result.stdout)
-            duration_seconds = int(info.get("duration", 0))
             
-            # Handle very long durations (like livestreams)
-            if duration_seconds > 24*60*60:  # If longer than 24 hours
-                return "Live"
+            return self._format_duration(result.stdout.strip())
                 
-            hours = duration_seconds // 3600
-            minutes = (duration_seconds % 3600) // 60
-            seconds = duration_seconds % 60
-            
-            # Format based on length
-            if hours > 0:
-                return f"{hours:01d}:{minutes:02d}:{seconds:02d}"
-            else:
-                return f"{minutes:02d}:{seconds:02d}"
-                
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
-            print(f"Error fetching duration: {e}")
+        except Exception:
+            # Runs while curses owns the terminal, so nothing is printed;
+            # "Unknown" is what the caller shows for any failure
             return "Unknown"
     
-    def save_playlist(self):
-        """Menyimpan playlist ke file JSON"""
+    def _format_duration(self, raw):
+        """Format yt-dlp's duration output (seconds) as MM:SS, H:MM:SS or Live"""
+        # yt-dlp prints "NA" when the duration is not known; that raises
+        duration_seconds = int(float(raw))
+        
+        # Handle very long durations (like livestreams)
+        if duration_seconds > 24*60*60:  # If longer than 24 hours
+            return "Live"
+            
+        hours = duration_seconds // 3600
+        minutes = (duration_seconds % 3600) // 60
+        seconds = duration_seconds % 60
+        
+        # Format based on length
+        if hours > 0:
+            return f"{hours:01d}:{minutes:02d}:{seconds:02d}"
+        else:
+            return f"{minutes:02d}:{seconds:02d}"
+    
+    def fetch_durations(self, urls, on_result=None):
+        """Ambil durasi beberapa URL dengan satu proses yt-dlp
+        
+        Returns {url: duration}; URLs yt-dlp could not resolve are missing.
+        on_result(url, duration) is called as each line arrives.
+        """
+        durations = {}
         try:
-            # Create backup of existing playlist
-            if os.path.exists(self.playlist_file):
-                backup_file = f"{os.path.splitext(self.playlist_file)[0]}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+            # Each line names the URL it belongs to, so failed URLs (which
+            # print nothing) cannot shift the results of the others
+            process = subprocess.Popen(
+                ["yt-dlp", "--print", "%(original_url)s %(duration)s",
+                 *DURATION_FETCH_ARGS, "--ignore-errors", *urls],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            with process:
+                for line in process.stdout:
+                    url, _, raw = line.rstrip('\n').rpartition(' ')
+                    try:
+                        duration = self._format_duration(raw)
+                    except ValueError:
+                        duration = "Unknown"
+                    durations[url] = duration
+                    if on_result:
+                        on_result(url, duration)
+        except Exception:
+            # Runs on a background pool while curses owns the terminal, so
+            # nothing is printed; unresolved URLs are simply missing
+            pass
+        return durations
+    
+    def schedule_save(self):
+        """Tandai playlist berubah; disimpan oleh flusher dalam beberapa detik"""
+        self._dirty = True
+        self._index_dirty = True
+        self._dirty_event.set()
+    
+    def flush(self):
+        """Simpan sekarang jika ada perubahan yang belum ditulis"""
+        if self._dirty:
+            return self.save_playlist()
+        return True, "Playlist sudah tersimpan"
+    
+    def _flush_loop(self):
+        """Background loop that writes pending changes after a short delay"""
+        while True:
+            self._dirty_event.wait()
+            # Let a burst of edits settle before writing once
+            time.sleep(SAVE_DEBOUNCE_DELAY)
+            self._dirty_event.clear()
+            self.flush()
+    
+    def save_playlist(self, backup=False):
+        """Menyimpan playlist ke file JSON (dengan backup jika diminta)"""
+        with self._save_lock:
+            self._dirty = False
+            # Shallow copy so edits on other threads can't change it mid-dump
+            songs = [dict(song) for song in self.songs]
+            return self._write_playlist(songs, backup)
+    
+    def _write_playlist(self, songs, backup=False):
+        """Write the playlist file, optionally keeping a timestamped backup"""
+        try:
+            # Keep the current file as a backup; the new one is written to a
+            # fresh inode below, so a hard link preserves it without copying
+            if backup and os.path.exists(self.playlist_file):
+                backup_file = f"{os.path.splitext(self.playlist_file)[0]}_backup_{datetime.now():%Y%m%d%H%M%S}.json"
                 try:
-                    with open(self.playlist_file, 'r', encoding='utf-8') as src:
-                        with open(backup_file, 'w', encoding='utf-8') as dst:
-                            dst.write(src.read())
+                    try:
+                        os.link(self.playlist_file, backup_file)
+                    except OSError:
+                        # No hard links here (or name taken); fall back to a copy
+                        shutil.copyfile(self.playlist_file, backup_file)
                 except Exception as e:
                     print(f"Warning: Could not create playlist backup: {e}")
             
-            # Save current playlist
-            with open(self.playlist_file, 'w', encoding='utf-8') as file:
-                json.dump(self.songs, file, indent=4, ensure_ascii=False)
+            # Save current playlist via a temp file so a crash mid-write
+            # can never leave a truncated playlist behind
+            # Saves are frequent and machine-read; exports stay indented
+            data = _dump_json(songs, pretty=False)
+            playlist_dir = os.path.dirname(os.path.abspath(self.playlist_file))
+            try:
+                mode = stat.S_IMODE(os.stat(self.playlist_file).st_mode)
+            except FileNotFoundError:
+                mode = NEW_FILE_MODE
+            tmp = tempfile.NamedTemporaryFile('wb', dir=playlist_dir, delete=False)
+            try:
+                with tmp:
+                    tmp.write(data)
+                # Keep the existing file's permissions, not the temp file's 0600
+                os.chmod(tmp.name, mode)
+                os.replace(tmp.name, self.playlist_file)
+            except BaseException:
+                # Don't leave a stray temp file next to the playlist
+                os.unlink(tmp.name)
+                raise
+            # songs is already a private copy, so the cache can keep it
+            path = os.path.abspath(self.playlist_file)
+            st = os.stat(path)
+            _PLAYLIST_CACHE[path] = ((st.st_mtime_ns, st.st_size), songs)
             return True, "Playlist berhasil disimpan!"
         except Exception as e:
             return False, f"Gagal menyimpan playlist: {e}"
     
-    def add_song(self, title, artist, url, duration="Unknown"):
-        """Menambahkan lagu baru ke playlist dengan validasi"""
+    def add_song(self, title, artist, url, duration="Unknown", fetch_missing=True):
+        """Menambahkan lagu baru ke playlist dengan validasi
+        
+        fetch_missing=False keeps an "Unknown" duration instead of running
+        yt-dlp, for callers that already tried off the main thread.
+        """
         # Validate song data
         errors = self.validate_song_data(title, artist, url, duration)
         if errors:
             return -1, f"Error: {'; '.join(errors)}"
         
         # Auto fetch duration if not provided or unknown
-        if duration == "Unknown":
+        if duration == "Unknown" and fetch_missing:
             duration = self.fetch_duration(url)
         
         new_song = {
@@ -146,11 +341,17 @@ class PlaylistManager:
             "artist": artist or "Unknown Artist",
             "url": url,
             "duration": duration,
-            "added_date": datetime.now().strftime("%Y-%m-%d")
+            "added_date": date.today().isoformat()
         }
         
         self.songs.append(new_song)
-        self.save_playlist()  # Auto-save after adding
+        if self.shuffle_mode and len(self.shuffle_history) == len(self.songs) - 1:
+            # Slot the new song into the part of the order not yet played
+            # (clamped: an empty order has shuffle_index 0 and nothing after it)
+            history_len = len(self.shuffle_history)
+            position = random.randint(min(self.shuffle_index + 1, history_len), history_len)
+            self.shuffle_history.insert(position, len(self.songs) - 1)
+        self.schedule_save()  # Auto-save after adding
         return len(self.songs) - 1, f"Lagu '{title}' berhasil ditambahkan"  # Return index of new song
     
     def update_song(self, index, title=None, artist=None, url=None, duration=None):
@@ -181,10 +382,10 @@ class PlaylistManager:
             self.songs[index]["artist"] = new_artist
             self.songs[index]["url"] = new_url
             self.songs[index]["duration"] = new_duration
-            self.songs[index]["updated_date"] = datetime.now().strftime("%Y-%m-%d")
+            self.songs[index]["updated_date"] = date.today().isoformat()
             
             # Auto-save after updating
-            self.save_playlist()
+            self.schedule_save()
             return True, "Lagu berhasil diperbarui"
         return False, "Indeks lagu tidak valid"
     
@@ -192,8 +393,22 @@ class PlaylistManager:
         """Menghapus lagu dari playlist"""
         if 0 <= index < len(self.songs):
             deleted = self.songs.pop(index)
+            if self.shuffle_mode and len(self.shuffle_history) == len(self.songs) + 1:
+                # Drop the song from the order and shift later indices down
+                # instead of reshuffling everything
+                position = self.shuffle_history.index(index)
+                # Deleting the current slot also steps back, so the song that
+                # moves into it is the next one played rather than skipped
+                if position <= self.shuffle_index:
+                    self.shuffle_index -= 1
+                self.shuffle_history = [i if i < index else i - 1
+                                        for i in self.shuffle_history if i != index]
+                if self.shuffle_history:
+                    self.shuffle_index %= len(self.shuffle_history)
+                else:
+                    self.shuffle_index = 0
             # Auto-save after deletion
-            self.save_playlist()
+            self.schedule_save()
             return True, f"Lagu '{deleted['title']}' berhasil dihapus"
         return False, "Indeks lagu tidak valid"
     
@@ -201,11 +416,11 @@ class PlaylistManager:
         """Export playlist to different formats"""
         try:
             if format.lower() == "json":
-                with open(filename, 'w', encoding='utf-8') as file:
-                    json.dump(self.songs, file, indent=4, ensure_ascii=False)
+                with open(filename, 'wb') as file:
+                    file.write(_dump_json(self.songs))
                     
             elif format.lower() == "m3u":
-                with open(filename, 'w', encoding='utf-8') as file:
+                with open(filename, 'w', encoding='utf-8', buffering=TEXT_FILE_BUFFER_SIZE) as file:
                     file.write("#EXTM3U\n")
                     for song in self.songs:
                         duration_secs = self._duration_to_seconds(song.get("duration", "Unknown"))
@@ -213,19 +428,21 @@ class PlaylistManager:
                         file.write(f"{song['url']}\n")
                         
             elif format.lower() == "csv":
-                with open(filename, 'w', encoding='utf-8', newline='') as file:
+                with open(filename, 'w', encoding='utf-8', newline='', buffering=TEXT_FILE_BUFFER_SIZE) as file:
                     writer = csv.writer(file)
                     # Write header
                     writer.writerow(["Title", "Artist", "URL", "Duration", "Added Date"])
-                    # Write songs
-                    for song in self.songs:
-                        writer.writerow([
+                    # Write songs; writerows drives the loop from C
+                    writer.writerows(
+                        (
                             song["title"],
                             song.get("artist", "Unknown Artist"),
                             song["url"],
                             song.get("duration", "Unknown"),
                             song.get("added_date", "")
-                        ])
+                        )
+                        for song in self.songs
+                    )
             else:
                 return False, f"Format '{format}' tidak didukung"
                 
@@ -237,17 +454,25 @@ class PlaylistManager:
         """Import playlist from different formats"""
         try:
             imported_songs = []
+            # One date for the whole import rather than one per song
+            today = date.today().isoformat()
             
             if format.lower() == "json":
-                with open(filename, 'r', encoding='utf-8') as file:
-                    imported_songs = json.load(file)
+                with open(filename, 'rb') as file:
+                    if ijson is not None and os.fstat(file.fileno()).st_size > IMPORT_STREAM_THRESHOLD:
+                        # Never hold the whole document and its parse tree at once
+                        imported_songs = list(ijson.items(file, 'item', use_float=True))
+                    else:
+                        imported_songs = _load_json(file.read())
                     
             elif format.lower() == "m3u":
-                with open(filename, 'r', encoding='utf-8') as file:
-                    lines = file.readlines()
-                    i = 0
-                    while i < len(lines):
-                        line = lines[i].strip()
+                with open(filename, 'r', encoding='utf-8', buffering=TEXT_FILE_BUFFER_SIZE) as file:
+                    # One streaming pass; the last #EXTINF seen is held until
+                    # the next URL line, so comments or blank lines in
+                    # between do not break the pairing
+                    pending = None
+                    for line in file:
+                        line = line.strip()
                         if line.startswith("#EXTINF:"):
                             # Parse EXTINF line
                             info_parts = line[8:].split(',', 1)
@@ -258,24 +483,23 @@ class PlaylistManager:
                                 else:
                                     artist = "Unknown Artist"
                                     title = title_artist
-                                
-                                # Get URL from next line
-                                if i + 1 < len(lines):
-                                    url = lines[i + 1].strip()
-                                    duration = "Unknown"  # M3U doesn't have reliable duration info
-                                    
-                                    imported_songs.append({
-                                        "title": title,
-                                        "artist": artist,
-                                        "url": url,
-                                        "duration": duration,
-                                        "added_date": datetime.now().strftime("%Y-%m-%d")
-                                    })
-                                    i += 1  # Skip the URL line
-                        i += 1
+                                pending = (artist, title)
+                            else:
+                                pending = None
+                        elif line and not line.startswith("#"):
+                            # Plain M3U entries have no #EXTINF; use the URL as title
+                            artist, title = pending or ("Unknown Artist", line)
+                            pending = None
+                            imported_songs.append({
+                                "title": title,
+                                "artist": artist,
+                                "url": line,
+                                "duration": "Unknown",  # M3U doesn't have reliable duration info
+                                "added_date": today
+                            })
                         
             elif format.lower() == "csv":
-                with open(filename, 'r', encoding='utf-8', newline='') as file:
+                with open(filename, 'r', encoding='utf-8', newline='', buffering=TEXT_FILE_BUFFER_SIZE) as file:
                     reader = csv.reader(file)
                     header = next(reader, None)  # Skip header
                     
@@ -291,7 +515,7 @@ class PlaylistManager:
                                 "artist": artist,
                                 "url": url,
                                 "duration": duration,
-                                "added_date": datetime.now().strftime("%Y-%m-%d")
+                                "added_date": today
                             })
             else:
                 return False, f"Format '{format}' tidak didukung"
@@ -303,7 +527,7 @@ class PlaylistManager:
                 self.songs.extend(imported_songs)
                 
             # Save the updated playlist
-            self.save_playlist()
+            self.schedule_save()
             
             return True, f"Berhasil mengimpor {len(imported_songs)} lagu"
         except Exception as e:
@@ -314,19 +538,24 @@ class PlaylistManager:
         if fields is None:
             fields = ["title", "artist"]
             
-        results = []
+        if self._index_dirty or len(self._lowercase_index) != len(self.songs):
+            self._lowercase_index = [
+                {key: str(value).lower() for key, value in song.items()}
+                for song in self.songs
+            ]
+            self._index_dirty = False
+            
         query = query.lower()
-        
-        for i, song in enumerate(self.songs):
-            for field in fields:
-                if field in song and query in str(song[field]).lower():
-                    results.append((i, song))
-                    break  # Don't add the same song twice
-                    
-        return results
+        return [
+            (i, self.songs[i])
+            for i, lowered in enumerate(self._lowercase_index)
+            if any(query in lowered[field] for field in fields if field in lowered)
+        ]
     
-    def _duration_to_seconds(self, duration):
-        """Convert duration string to seconds"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _duration_to_seconds(duration):
+        """Convert duration string to seconds (memoised; durations repeat a lot)"""
         if duration == "Unknown" or duration == "Live":
             return -1
             
@@ -351,18 +580,28 @@ class PlaylistManager:
         """Mengaktifkan/menonaktifkan mode shuffle"""
         self.shuffle_mode = not self.shuffle_mode
         if self.shuffle_mode:
-            # Buat daftar acak baru
-            self.shuffle_history = list(range(len(self.songs)))
-            random.shuffle(self.shuffle_history)
-            self.shuffle_index = 0
+            self._reshuffle()
         return self.shuffle_mode
     
+    def _reshuffle(self):
+        """Buat urutan acak baru untuk seluruh playlist"""
+        count = len(self.songs)
+        if np is not None:
+            # tolist() hands back plain ints so callers can index self.songs
+            self.shuffle_history = np.random.default_rng().permutation(count).tolist()
+        else:
+            self.shuffle_history = random.sample(range(count), count)
+        self.shuffle_index = 0
+    
     def get_next_song_index(self, current_index):
         """Mendapatkan indeks lagu berikutnya berdasarkan mode"""
         if not self.songs:
             return 0
         
         if self.shuffle_mode:
+            # Urutan acak dibuat sekali; buat ulang hanya jika jumlah lagu berubah
+            if len(self.shuffle_history) != len(self.songs):
+                self._reshuffle()
             # Jika shuffle mode aktif, ambil dari shuffle history
             self.shuffle_index = (self.shuffle_index + 1) % len(self.shuffle_history)
             return self.shuffle_history[self.shuffle_index]
@@ -376,6 +615,8 @@ class PlaylistManager:
             return 0
         
         if self.shuffle_mode:
+            if len(self.shuffle_history) != len(self.songs):
+                self._reshuffle()
             # Jika shuffle mode aktif, mundur di shuffle history
             self.shuffle_index = (self.shuffle_index - 1) % len(self.shuffle_history)
             return self.shuffle_history[self.shuffle_index]
@@ -387,21 +628,68 @@ class PlaylistManager:
         """Cek apakah mode shuffle aktif"""
         return self.shuffle_mode
         
-    def update_all_durations(self, callback=None):
+    def update_all_durations(self, callback=None, max_workers=8):
         """Update durasi untuk semua lagu dengan durasi yang tidak diketahui"""
-        updated_count = 0
+        urls = self.unknown_duration_urls()
+        if not urls:
+            return 0
+        return self.apply_durations(self.fetch_all_durations(urls, callback, max_workers))
+    
+    def unknown_duration_urls(self):
+        """URL (tanpa duplikat) dari lagu yang durasinya belum diketahui"""
+        return list(dict.fromkeys(
+            song["url"] for song in self.songs
+            if song.get("duration", "Unknown") == "Unknown"
+        ))
+    
+    def fetch_all_durations(self, urls, callback=None, max_workers=8):
+        """Resolve durations for urls; returns {url: duration} for those found
         
-        for i, song in enumerate(self.songs):
-            if callback:
-                callback(i, len(self.songs), song["title"])
-                
-            if song.get("duration") == "Unknown":
-                new_duration = self.fetch_duration(song["url"])
-                if new_duration != "Unknown":
-                    self.songs[i]["duration"] = new_duration
-                    updated_count += 1
+        Reads and writes no playlist state, so it is safe to run on a worker
+        thread; apply the result with apply_durations on the owning thread.
+        callback(done, total, url) is called once per URL.
+        """
+        if not urls:
+            return {}
+        
+        # A few yt-dlp processes, each resolving a batch of URLs, instead of
+        # one process per song; the batches still run concurrently
+        batch_count = min(max_workers, len(urls))
+        batches = [urls[i::batch_count] for i in range(batch_count)]
+        
+        lock = threading.Lock()
+        durations = {}
+        done = 0
+        
+        def _on_result(url, duration):
+            nonlocal done
+            with lock:
+                done += 1
+                if duration != "Unknown":
+                    durations[url] = duration
+                if callback:
+                    callback(done, len(urls), url)
+        
+        with ThreadPoolExecutor(max_workers=batch_count) as executor:
+            futures = [executor.submit(self.fetch_durations, batch, _on_result) for batch in batches]
+            for future, batch in zip(futures, batches):
+                resolved = future.result()
+                # URLs yt-dlp failed on still count towards progress
+                for url in batch:
+                    if url not in resolved:
+                        _on_result(url, "Unknown")
+        
+        return durations
+    
+    def apply_durations(self, durations):
+        """Isi durasi lagu yang masih "Unknown"; mengembalikan jumlah lagu yang diperbarui"""
+        updated_count = 0
+        for song in self.songs:
+            if song.get("duration", "Unknown") == "Unknown" and song.get("url") in durations:
+                song["duration"] = durations[song["url"]]
+                updated_count += 1
         
         if updated_count > 0:
-            self.save_playlist()
+            self.schedule_save()
             
         return updated_count
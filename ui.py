@@ -5,11 +5,79 @@ import threading
 import json
 import curses
 import locale
-import re
-import math
+import functools
+from collections import deque
 from queue import Queue, Empty
 from typing import Dict, List, Any, Optional, Callable, Tuple
 
+@functools.lru_cache(maxsize=1024)
+def _format_playlist_row(number: int, title: str, duration: str, width: int) -> str:
+    """Format one playlist row, truncating the title to fit the screen width"""
+    number = f"{number:02d}"
+    
+    # Truncate if needed
+    max_title_len = width - len(number) - len(duration) - 8
+    if len(title) > max_title_len:
+        title = title[:max_title_len - 3] + "..."
+    
+    return f" {number}. {title} - {duration} "
+
+@functools.lru_cache(maxsize=1024)
+def _time_to_seconds(time_str: str) -> int:
+    """Convert MM:SS or H:MM:SS to seconds; raises ValueError otherwise"""
+    seconds = 0
+    for part in time_str.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+# (epoch second, "HH:MM:SS") of the last message timestamp; messages often
+# arrive in bursts within the same second
+_last_timestamp = (None, "")
+
+def _message_timestamp() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _last_timestamp
+    now = int(time.time())
+    second, text = _last_timestamp
+    if now != second:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        # One tuple assignment, so concurrent callers never see a torn pair
+        _last_timestamp = (now, text)
+    return text
+
+# One-character strings for ASCII key codes, indexed instead of calling chr()
+_ASCII_CHARS = tuple(map(chr, range(128)))
+
+# Frames of the processing spinner, advanced ten times a second
+_SPINNER = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+
+# Parsed custom theme files by path -> ((mtime_ns, size), theme); another
+# ThemeManager only re-reads files that changed on disk
+_THEME_FILE_CACHE = {}
+
+# Symbols shared by the built-in themes; a theme that differs spreads this
+# into its own dict with just the overrides. Treat it as read-only.
+_DEFAULT_SYMBOLS = {
+    "playing": "▶",
+    "paused": "⏸",
+    "stopped": "⏹",
+    "progress_fill": "█",
+    "progress_empty": "░",
+    "visualizer_block": "█",
+    "visualizer_wave": "▁▂▃▄▅▆▇█",
+    "volume": "🔊",
+    "playlist": "🎵",
+    "download": "⬇",
+    "search": "🔍",
+    "menu": "≡",
+    "next": "⏭",
+    "prev": "⏮",
+    "shuffle": "🔀",
+    "repeat": "🔁",
+    "heart": "♥",
+    "clock": "⏱"
+}
+
 class ThemeManager:
     """
     Enhanced Theme Manager with support for:
@@ -22,27 +90,42 @@ class ThemeManager:
         self.themes_dir = themes_dir
         self.current_theme = "default"
         self.themes = self._load_themes()
+        self._activate_theme()
         
     def _load_themes(self) -> Dict[str, Dict[str, Any]]:
-        """Load built-in and custom themes"""
+        """Load built-in and custom themes
+        
+        Built-in themes are stored as their factory methods and only built
+        when first used (see _get_theme); custom themes are read eagerly.
+        """
         themes = {
-            "default": self._create_default_theme(),
-            "dark": self._create_dark_theme(),
-            "matrix": self._create_matrix_theme(),
-            "light": self._create_light_theme()
+            "default": self._create_default_theme,
+            "dark": self._create_dark_theme,
+            "matrix": self._create_matrix_theme,
+            "light": self._create_light_theme
         }
         
         # Load custom themes from themes directory
-        if os.path.exists(self.themes_dir):
-            for theme_file in os.listdir(self.themes_dir):
-                if theme_file.endswith(".json"):
+        if os.path.isdir(self.themes_dir):
+            # scandir hands back the stat info used as the cache key
+            with os.scandir(self.themes_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
                     try:
-                        with open(os.path.join(self.themes_dir, theme_file), 'r') as f:
-                            theme_data = json.load(f)
-                            theme_name = os.path.splitext(theme_file)[0]
-                            themes[theme_name] = theme_data
+                        stat = entry.stat()
+                        key = (stat.st_mtime_ns, stat.st_size)
+                        cached = _THEME_FILE_CACHE.get(entry.path)
+                        if cached is not None and cached[0] == key:
+                            theme_data = cached[1]
+                        else:
+                            with open(entry.path, 'r') as f:
+                                theme_data = json.load(f)
+                            _THEME_FILE_CACHE[entry.path] = (key, theme_data)
+                        theme_name = os.path.splitext(entry.name)[0]
+                        themes[theme_name] = theme_data
                     except Exception as e:
-                        print(f"Error loading theme {theme_file}: {e}")
+                        print(f"Error loading theme {entry.name}: {e}")
         
         return themes
     
@@ -75,26 +158,7 @@ class ThemeManager:
                 "equalizer": "\033[34m",
                 "reset": "\033[0m"
             },
-            "symbols": {
-                "playing": "▶",
-                "paused": "⏸",
-                "stopped": "⏹",
-                "progress_fill": "█",
-                "progress_empty": "░",
-                "visualizer_block": "█",
-                "visualizer_wave": "▁▂▃▄▅▆▇█",
-                "volume": "🔊",
-                "playlist": "🎵",
-                "download": "⬇",
-                "search": "🔍",
-                "menu": "≡",
-                "next": "⏭",
-                "prev": "⏮",
-                "shuffle": "🔀",
-                "repeat": "🔁",
-                "heart": "♥",
-                "clock": "⏱"
-            }
+            "symbols": _DEFAULT_SYMBOLS
         }
     
     def _create_dark_theme(self) -> Dict[str, Any]:
@@ -126,26 +190,7 @@ class ThemeManager:
                 "equalizer": "\033[38;5;33m",
                 "reset": "\033[0m"
             },
-            "symbols": {
-                "playing": "▶",
-                "paused": "⏸",
-                "stopped": "⏹",
-                "progress_fill": "█",
-                "progress_empty": "▒",
-                "visualizer_block": "█",
-                "visualizer_wave": "▁▂▃▄▅▆▇█",
-                "volume": "🔊",
-                "playlist": "🎵",
-                "download": "⬇",
-                "search": "🔍",
-                "menu": "≡",
-                "next": "⏭",
-                "prev": "⏮",
-                "shuffle": "🔀",
-                "repeat": "🔁",
-                "heart": "♥",
-                "clock": "⏱"
-            }
+            "symbols": {**_DEFAULT_SYMBOLS, "progress_empty": "▒"}
         }
     
     def _create_matrix_theme(self) -> Dict[str, Any]:
@@ -177,26 +222,7 @@ class ThemeManager:
                 "equalizer": "\033[38;5;28m",
                 "reset": "\033[0m"
             },
-            "symbols": {
-                "playing": "▶",
-                "paused": "⏸",
-                "stopped": "⏹",
-                "progress_fill": "█",
-                "progress_empty": "░",
-                "visualizer_block": "█",
-                "visualizer_wave": "▁▂▃▄▅▆▇█",
-                "volume": "🔊",
-                "playlist": "🎵",
-                "download": "⬇",
-                "search": "🔍",
-                "menu": "≡",
-                "next": "⏭",
-                "prev": "⏮",
-                "shuffle": "🔀",
-                "repeat": "🔁",
-                "heart": "♥",
-                "clock": "⏱"
-            }
+            "symbols": _DEFAULT_SYMBOLS
         }
     
     def _create_light_theme(self) -> Dict[str, Any]:
@@ -228,58 +254,52 @@ class ThemeManager:
                 "equalizer": "\033[33m",
                 "reset": "\033[0m"
             },
-            "symbols": {
-                "playing": "▶",
-                "paused": "⏸",
-                "stopped": "⏹",
-                "progress_fill": "█",
-                "progress_empty": "░",
-                "visualizer_block": "█",
-                "visualizer_wave": "▁▂▃▄▅▆▇█",
-                "volume": "🔊",
-                "playlist": "🎵",
-                "download": "⬇",
-                "search": "🔍",
-                "menu": "≡",
-                "next": "⏭",
-                "prev": "⏮",
-                "shuffle": "🔀",
-                "repeat": "🔁",
-                "heart": "♥",
-                "clock": "⏱"
-            }
+            "symbols": _DEFAULT_SYMBOLS
         }
     
     def set_theme(self, theme_name: str) -> bool:
         """Set the current theme by name"""
         if theme_name in self.themes:
             self.current_theme = theme_name
+            self._activate_theme()
             return True
         return False
     
+    def _activate_theme(self):
+        """Cache the current theme's color and symbol tables for the getters"""
+        theme = self._get_theme(self.current_theme if self.current_theme in self.themes else "default")
+        self._active_colors = theme.get("colors", {})
+        self._active_symbols = theme.get("symbols", {})
+    
+    def _get_theme(self, theme_name: str) -> Dict[str, Any]:
+        """Return a theme's dict, building a built-in theme on first use"""
+        theme = self.themes[theme_name]
+        if callable(theme):
+            theme = self.themes[theme_name] = theme()
+        return theme
+    
     def get_theme_names(self) -> List[str]:
         """Get list of available theme names"""
         return list(self.themes.keys())
     
     def get_color(self, color_name: str) -> str:
         """Get ANSI color code for the current theme"""
-        theme = self.themes.get(self.current_theme, self.themes["default"])
-        return theme["colors"].get(color_name, "")
+        return self._active_colors.get(color_name, "")
     
     def get_symbol(self, symbol_name: str) -> str:
         """Get symbol for the current theme"""
-        theme = self.themes.get(self.current_theme, self.themes["default"])
-        return theme["symbols"].get(symbol_name, "")
+        return self._active_symbols.get(symbol_name, "")
     
     def get_theme_colors(self) -> Dict[str, str]:
         """Get all colors for the current theme"""
-        return self.themes.get(self.current_theme, self.themes["default"])["colors"]
+        return self._active_colors
     
     def get_theme_info(self) -> Dict[str, str]:
         """Get theme metadata"""
+        theme = self._get_theme(self.current_theme)
         return {
-            "name": self.themes[self.current_theme]["name"],
-            "description": self.themes[self.current_theme]["description"]
+            "name": theme["name"],
+            "description": theme["description"]
         }
 
 class UI:
@@ -292,17 +312,71 @@ class UI:
     - Interactive forms
     - Responsive layout
     """
-    def __init__(self):
+    # Rows of the playing screen, below the one-line header
+    _SONG_Y = 2
+    _PROGRESS_Y = 5
+    _CONTROLS_Y = 7
+    _STATUS_Y = 9
+    # Visualizer/equalizer panels stack from here, each this many rows tall
+    _PANELS_Y = 11
+    _PANEL_HEIGHT = 6
+    
+    # Centred on the idle screen; its column is set in _update_layout
+    _IDLE_MSG = "♫ Ready to play music ♫"
+    
+    # Help panel shown above the footer while show_help is on
+    _HELP_LINES = (
+        "Controls:",
+        " ┌───────────────────────────────┐",
+        " │ q: Quit        s: Stop        │",
+        " │ p: Play        pause: Pause   │",
+        " │ n: Next        prev: Previous │",
+        " │ r: Shuffle     t: Theme       │",
+        " │ v: Visualizer  h: Help        │",
+        " └───────────────────────────────┘",
+        "Playlist:",
+        " ┌─────────────────────────────────────────────┐",
+        " │ a: Add Song   e: Edit Song   d: Delete Song │",
+        " │ i: Info  I: Refresh Info  save: Save List   │",
+        " └─────────────────────────────────────────────┘",
+        "Download:",
+        " ┌────────────────────────────────────────────┐",
+        " │ dl: Download Current  dla: Download All    │",
+        " │ auto: Toggle Auto-Download                 │",
+        " └────────────────────────────────────────────┘",
+    )
+    
+    def __init__(self, redraw_event: Optional[threading.Event] = None):
         # Set up locale for proper UTF-8 support
         locale.setlocale(locale.LC_ALL, '')
         
+        # Signalled whenever the UI needs to be redrawn (input, new messages)
+        self.redraw_event = redraw_event or threading.Event()
+        
+        # Serializes drawing against message updates coming from background threads
+        self.render_lock = threading.RLock()
+        
         # UI state
-        self.messages = []
         self.max_messages = 5
+        # Oldest messages fall off the left end automatically
+        self.messages = deque(maxlen=self.max_messages)
         self.command_queue = Queue()
         self.screen = None
         self.screen_height = 0
         self.screen_width = 0
+        # Header/footer bars for the current width; see _update_layout
+        self._pad_space = ""
+        self._pad_hline = ""
+        self._help_layout = ()
+        self._idle_msg_x = 0
+        # (state, (x, text)) of the last controls/status line drawn
+        self._controls_cache = (None, None)
+        self._status_cache = (None, None)
+        self._processing_cache = (None, None)
+        # Inputs of the last playing-state frame drawn, and a counter that
+        # changes whenever a message is added; see render_playing_state
+        self._last_frame_key = None
+        self._message_serial = 0
         self.input_buffer = ""
         self.show_help = False
         self.form_active = False
@@ -316,10 +390,9 @@ class UI:
         # Initialize theme manager
         self.theme_manager = ThemeManager()
         
-        # Initialize curses in a separate thread to avoid blocking
-        self.curses_ready = threading.Event()
-        threading.Thread(target=self._init_curses, daemon=True).start()
-        self.curses_ready.wait()  # Wait for curses to initialize
+        # Initialize curses on the calling (main) thread; nothing else can
+        # run until the screen exists, and curses is not thread-safe
+        self._init_curses()
     
     def _init_curses(self):
         """Initialize curses screen with proper input settings"""
@@ -335,9 +408,9 @@ class UI:
 
             # Get screen dimensions
             self.screen_height, self.screen_width = self.screen.getmaxyx()
+            self._update_layout()
             
             self._init_color_pairs()
-            self.curses_ready.set()
         except Exception as e:
             if curses.isendwin():
                 curses.endwin()
@@ -393,51 +466,156 @@ class UI:
 
             # Get key from curses
             key = self.screen.getch()
-            
-            # Handle special keys first
-            if key == curses.KEY_RESIZE:
-                self._handle_resize()
+            if key == -1:
                 return None
+            return self._process_key(key)
         
-            # Convert key to character
-            char = None
-            if 0 <= key <= 255:
-                char = chr(key)
-        
-            # Process control characters
-            if char and char.isprintable():
-                if char == 'h':
-                    self.show_help = not self.show_help
-                elif char in ['p', 's', 'n', 'q', 'r', 't', 'v']:
-                    return char
-                elif char == '\n':  # Enter key
-                    if self.input_buffer:
-                        cmd = self.input_buffer
-                        self.input_buffer = ""
-                        return cmd
-                elif char == '\x7f' or char == '\b':  # Backspace
-                    self.input_buffer = self.input_buffer[:-1]
-                else:
-                    self.input_buffer += char
-                
+        except Exception as e:
+            self.add_message(f"Input error: {str(e)}", error=True)
             return None
+    
+    def read_commands(self) -> List[str]:
+        """Consume every key curses has buffered without blocking"""
+        commands = []
+        try:
+            while True:
+                commands.append(self.command_queue.get_nowait())
+        except Empty:
+            pass
         
+        try:
+            # curses may have read several keys (e.g. a paste) off stdin at
+            # once, so drain its buffer rather than taking a single key
+            self.screen.nodelay(True)
+            while True:
+                key = self.screen.getch()
+                if key == -1:
+                    break
+                command = self._process_key(key)
+                if command:
+                    commands.append(command)
         except Exception as e:
             self.add_message(f"Input error: {str(e)}", error=True)
+        finally:
+            self.screen.timeout(300)
+        return commands
+    
+    def _process_key(self, key: int) -> Optional[str]:
+        """Apply one key to the input line; return a command when one is complete"""
+        # Any keypress may change the input line or help panel
+        self.redraw_event.set()
+        
+        # Handle special keys first
+        if key == curses.KEY_RESIZE:
+            self._handle_resize()
             return None
     
+        # Editing keys, then single-key commands, then plain text; all
+        # integer compares, a character only for printable ASCII
+        action = self._KEY_ACTIONS.get(key)
+        if action is not None:
+            return action(self)
+        if key in self._COMMAND_KEYS:
+            return _ASCII_CHARS[key]
+        if 32 <= key <= 126:
+            self.input_buffer += _ASCII_CHARS[key]
+        return None
+    
+    def _toggle_help(self):
+        self.show_help = not self.show_help
+    
+    def _submit_input(self):
+        """Enter: hand the typed line over as a command"""
+        if self.input_buffer:
+            cmd = self.input_buffer
+            self.input_buffer = ""
+            return cmd
+        return None
+    
+    def _backspace(self):
+        self.input_buffer = self.input_buffer[:-1]
+    
+    def _force_repaint(self):
+        """Ctrl-L: repaint the whole terminal on the next frame"""
+        with self.render_lock:
+            # The only clear() outside resizes; regular frames erase()
+            self.screen.clear()
+            self._last_frame_key = None
+    
+    # Key codes that are returned as commands immediately
+    _COMMAND_KEYS = frozenset(map(ord, "psnqrtv"))
+    # Key codes with their own handler; a handler's return value is the command
+    _KEY_ACTIONS = {
+        ord('h'): _toggle_help,
+        10: _submit_input,   # Enter (\n)
+        13: _submit_input,   # Enter (\r)
+        127: _backspace,     # DEL, what most terminals send for Backspace
+        8: _backspace,       # ^H
+        curses.KEY_BACKSPACE: _backspace,
+        12: _force_repaint,  # Ctrl-L
+    }
+    
+    def handle_terminal_resize(self):
+        """Resize curses to the current terminal size (after SIGWINCH)"""
+        size = os.get_terminal_size(sys.__stdout__.fileno())
+        curses.resizeterm(size.lines, size.columns)
+        self._handle_resize()
+        self.redraw_event.set()
+    
+    def _handle_resize(self):
+        """Pick up new terminal dimensions and force one full repaint"""
+        with self.render_lock:
+            curses.update_lines_cols()
+            self.screen_height, self.screen_width = self.screen.getmaxyx()
+            self._update_layout()
+            self._last_frame_key = None
+            # Regular frames only erase(), letting curses send just the changed
+            # cells; after a resize the physical screen must be repainted fully
+            self.screen.clear()
+    
+    def _update_layout(self):
+        """Rebuild strings that depend only on the screen size"""
+        bar_width = min(self.screen_width, 200)
+        self._pad_space = " " * bar_width
+        self._pad_hline = "─" * bar_width
+        self._idle_msg_x = self._center_x(len(self._IDLE_MSG))
+        
+        # Lines laid out for the old width are stale now
+        self._controls_cache = (None, None)
+        self._status_cache = (None, None)
+        self._processing_cache = (None, None)
+        
+        # (y, x, line) for each help line that fits: centred, ending just
+        # above the footer rule and never over the header row
+        top = self.screen_height - 2 - len(self._HELP_LINES)
+        self._help_layout = tuple(
+            (top + idx, (self.screen_width - len(line)) // 2, line)
+            for idx, line in enumerate(self._HELP_LINES)
+            if top + idx >= 1 and len(line) < self.screen_width
+        )
+    
+    def _center_x(self, text_len: int) -> int:
+        """Column that centres text_len characters, never left of the screen"""
+        return max(0, (self.screen_width - text_len) // 2)
+    
+    def _addstr_clipped(self, y: int, x: int, text: str, attr: int):
+        """addstr that lets curses cut text at the right edge instead of raising"""
+        max_len = self.screen_width - x
+        if max_len > 0:
+            self.screen.addnstr(y, x, text, max_len, attr)
+    
     def add_message(self, message: str, error: bool = False):
         """Add a message to the message queue"""
-        timestamp = time.strftime("%H:%M:%S")
-        self.messages.append({
-            "text": message,
-            "error": error,
-            "time": timestamp
-        })
+        timestamp = _message_timestamp()
+        with self.render_lock:
+            self.messages.append({
+                "text": message,
+                "error": error,
+                "time": timestamp
+            })
+            self._message_serial += 1
         
-        # Limit message queue size
-        while len(self.messages) > self.max_messages:
-            self.messages.pop(0)
+        self.redraw_event.set()
     
     def toggle_theme(self):
         """Cycle through available themes"""
@@ -470,7 +648,7 @@ class UI:
             # Pastikan posisi y valid
             if 0 < self.screen_height:
                 # Draw header background
-                self.screen.addstr(0, 0, " " * min(self.screen_width, 200), curses.color_pair(2) | curses.A_BOLD)
+                self.screen.addstr(0, 0, self._pad_space, curses.color_pair(2) | curses.A_BOLD)
                 
                 # Draw header text
                 x_pos = max(0, (self.screen_width - len(header_text)) // 2)
@@ -494,38 +672,16 @@ class UI:
             y_pos = max(0, min(self.screen_height - 2, self.screen_height - 2))
             
             # Draw footer line
-            self.screen.addstr(y_pos, 0, "─" * min(self.screen_width, 200), curses.color_pair(1))
+            self.screen.addstr(y_pos, 0, self._pad_hline, curses.color_pair(1))
             
             # Draw status line
             y_pos = max(0, min(self.screen_height - 1, self.screen_height - 1))
             
             # Control tips
             if self.show_help:
-                help_lines = [
-                    "Controls:",
-                    " ┌───────────────────────────────┐",
-                    " │ q: Quit        s: Stop        │",
-                    " │ p: Play        pause: Pause   │",
-                    " │ n: Next        prev: Previous │",
-                    " │ r: Shuffle     t: Theme       │",
-                    " │ v: Visualizer  h: Help        │",
-                    " └───────────────────────────────┘",
-                    "Playlist:",
-                    " ┌─────────────────────────────────────────────┐",
-                    " │ a: Add Song   e: Edit Song   d: Delete Song │",
-                    " │ i: Info       save: Save Playlist           │",
-                    " └─────────────────────────────────────────────┘",
-                    "Download:",
-                    " ┌────────────────────────────────────────────┐",
-                    " │ dl: Download Current  dla: Download All    │",
-                    " │ auto: Toggle Auto-Download                 │",
-                    " └────────────────────────────────────────────┘",
-                ]
-
-                for idx, line in enumerate(help_lines):
-                    x_pos = max(0, (self.screen_width - len(line)) // 2)
-                    if y_pos + idx < self.screen_height - 1 and x_pos + len(line) < self.screen_width:
-                        self.screen.addstr(y_pos + idx, x_pos, line, curses.color_pair(6))
+                help_color = curses.color_pair(6)
+                for help_y, help_x, line in self._help_layout:
+                    self.screen.addstr(help_y, help_x, line, help_color)
             else:
                 status_text = " Press 'h' for help "
                 x_pos = max(0, (self.screen_width - len(status_text)) // 2)
@@ -553,20 +709,25 @@ class UI:
         if not self.screen:
             return
             
-        start_y = self.screen_height - 2 - len(self.messages)
+        width = self.screen_width
+        bottom = self.screen_height - 2
+        addstr = self.screen.addstr
+        error_color = curses.color_pair(4)
+        normal_color = curses.color_pair(1)
+        
+        start_y = bottom - len(self.messages)
         for i, msg in enumerate(self.messages):
             y_pos = start_y + i
-            if 0 <= y_pos < self.screen_height - 2:
+            if 0 <= y_pos < bottom:
                 # Format message with timestamp
                 message = f"[{msg['time']}] {msg['text']}"
                 
                 # Truncate if needed
-                if len(message) > self.screen_width:
-                    message = message[:self.screen_width - 3] + "..."
+                if len(message) > width:
+                    message = message[:width - 3] + "..."
                 
                 # Draw with appropriate color
-                color = curses.color_pair(4) if msg["error"] else curses.color_pair(1)
-                self.screen.addstr(y_pos, 0, message, color)
+                addstr(y_pos, 0, message, error_color if msg["error"] else normal_color)
     
     def _draw_visualizer(self, visualizer_data, y_pos, height=5):
         """Draw audio visualizer with multiple modes"""
@@ -585,20 +746,14 @@ class UI:
         wave_chars = self.theme_manager.get_symbol('visualizer_wave')
         visualizer_color = curses.color_pair(8)
         peak_color = curses.color_pair(10)
+        # Bound once; the wave loop calls it for every column
+        addstr = self.screen.addstr
         
         if mode == "spectrum":
             # Draw spectrum analyzer
             width = min(len(data), self.screen_width - 2)
-            for i in range(width):
-                value = min(data[i], height)
-                for j in range(height):
-                    if j >= height - value:
-                        try:
-                            # Use peak color for top of the bar
-                            color = peak_color if j == height - value else visualizer_color
-                            self.screen.addstr(y_pos + height - j - 1, i + 1, block_char, color)
-                        except:
-                            pass
+            self._draw_bar_rows(y_pos, height, [min(data[i], height) for i in range(width)],
+                                1, block_char, visualizer_color, peak_color)
         
         elif mode == "wave":
             # Draw waveform
@@ -609,27 +764,46 @@ class UI:
                 pos = middle + value
                 try:
                     char_idx = min(int((value + 1) * (len(wave_chars) / 2)), len(wave_chars) - 1)
-                    self.screen.addstr(y_pos + pos, i + 1, wave_chars[char_idx], visualizer_color)
+                    addstr(y_pos + pos, i + 1, wave_chars[char_idx], visualizer_color)
                 except:
                     pass
         
         elif mode == "bars":
             # Draw equalizer bars
             bar_width = max(1, (self.screen_width - 2) // len(data))
-            for i, value in enumerate(data):
-                value = min(value, height)
-                for j in range(height):
-                    if j >= height - value:
-                        try:
-                            x = i * bar_width + 1
-                            # Draw the bar
-                            for k in range(bar_width):
-                                if x + k < self.screen_width - 1:
-                                    # Use peak color for top of the bar
-                                    color = peak_color if j == height - value else visualizer_color
-                                    self.screen.addstr(y_pos + height - j - 1, x + k, block_char, color)
-                        except:
-                            pass
+            self._draw_bar_rows(y_pos, height, [min(value, height) for value in data],
+                                bar_width, block_char, visualizer_color, peak_color)
+    
+    def _draw_bar_rows(self, y_pos, height, values, bar_width, block_char, color, peak_color):
+        """Draw bars of the given heights starting at column 1
+        
+        Each screen row is built as one string and written with one addstr,
+        then each bar's peak cell is overlaid in peak_color, so a frame costs
+        O(height + bars) curses calls instead of one per cell.
+        """
+        addstr = self.screen.addstr
+        # Columns 1 .. screen_width - 2; the last column is never drawn
+        row_len = self.screen_width - 2
+        if row_len <= 0:
+            return
+        blank = " " * bar_width
+        block = block_char * bar_width
+        
+        for row in range(max(values, default=0) - 1):
+            # Body cells only; the lowest cell of each bar is its peak
+            text = "".join(block if row < value - 1 else blank for value in values)
+            try:
+                addstr(y_pos + row, 1, text[:row_len], color)
+            except curses.error:
+                pass
+        
+        for i, value in enumerate(values):
+            x = i * bar_width
+            if value > 0 and x < row_len:
+                try:
+                    addstr(y_pos + value - 1, x + 1, block[:row_len - x], peak_color)
+                except curses.error:
+                    pass
     
     def _draw_equalizer(self, eq_data, y_pos, height=5):
         """Draw audio equalizer bars"""
@@ -639,19 +813,10 @@ class UI:
         block_char = self.theme_manager.get_symbol('visualizer_block')
         eq_color = curses.color_pair(11)
         
-        # Draw frequency bands
+        # Draw frequency bands, one addstr per row; bands have no peak colour
         band_width = max(1, (self.screen_width - 2) // len(eq_data))
-        for i, value in enumerate(eq_data):
-            value = min(value, height)
-            for j in range(height):
-                if j >= height - value:
-                    try:
-                        x = i * band_width + 1
-                        for k in range(band_width):
-                            if x + k < self.screen_width - 1:
-                                self.screen.addstr(y_pos + height - j - 1, x + k, block_char, eq_color)
-                    except:
-                        pass
+        self._draw_bar_rows(y_pos, height, [min(value, height) for value in eq_data],
+                            band_width, block_char, eq_color, eq_color)
     
     def _draw_progress_bar(self, current_time, duration, y_pos, is_paused=False):
         """Draw playback progress bar with time display"""
@@ -660,8 +825,9 @@ class UI:
             
         # Calculate progress
         try:
-            current_sec = sum(x * int(t) for x, t in zip([60, 1], current_time.split(":")))
-            total_sec = sum(x * int(t) for x, t in zip([60, 1], duration.split(":")))
+            # Memoized: the same strings come back every frame
+            current_sec = _time_to_seconds(current_time)
+            total_sec = _time_to_seconds(duration)
             progress = current_sec / total_sec if total_sec > 0 else 0
         except:
             progress = 0
@@ -682,12 +848,17 @@ class UI:
         fill_char = self.theme_manager.get_symbol('progress_fill')
         empty_char = self.theme_manager.get_symbol('progress_empty')
         bar_color = curses.color_pair(9) if is_paused else curses.color_pair(5)
+        empty_color = curses.color_pair(1)
+        addstr = self.screen.addstr
+        bar_x = len(time_text) + 3
         
-        for i in range(bar_width):
-            if i < filled_width:
-                self.screen.addstr(y_pos, len(time_text) + 3 + i, fill_char, bar_color)
-            else:
-                self.screen.addstr(y_pos, len(time_text) + 3 + i, empty_char, curses.color_pair(1))
+        # Two runs, filled then empty, instead of one addstr per cell
+        if bar_width > 0:
+            filled_width = max(0, min(filled_width, bar_width))
+            if filled_width:
+                addstr(y_pos, bar_x, fill_char * filled_width, bar_color)
+            if filled_width < bar_width:
+                addstr(y_pos, bar_x + filled_width, empty_char * (bar_width - filled_width), empty_color)
     
     def _draw_song_info(self, song, y_pos, playback_source="STREAM"):
         """Draw current song information with source indicator"""
@@ -726,39 +897,47 @@ class UI:
         # Draw playlist title
         self.screen.addstr(y_pos, 0, "─── Playlist ───", curses.color_pair(2) | curses.A_BOLD)
         
+        addstr = self.screen.addstr
+        width = self.screen_width
+        row_color = curses.color_pair(1)
+        current_color = curses.color_pair(7)
+        
         # Draw playlist items
         for i in range(visible_songs):
             song_idx = start_idx + i
             if song_idx < total_songs:
                 song = songs[song_idx]
                 
-                # Format song entry
-                number = f"{song_idx + 1:02d}"
-                title = song.get("title", "Unknown")
-                artist = song.get("artist", "")
-                duration = song.get("duration", "00:00")
-                
-                # Truncate if needed
-                max_title_len = self.screen_width - len(number) - len(duration) - 8
-                if len(title) > max_title_len:
-                    title = title[:max_title_len - 3] + "..."
-                
-                song_text = f" {number}. {title} - {duration} "
+                # Format song entry (memoized, rows rarely change between frames)
+                song_text = _format_playlist_row(
+                    song_idx + 1,
+                    song.get("title", "Unknown"),
+                    song.get("duration", "00:00"),
+                    width
+                )
                 text_y_pos = y_pos + i + 1
                 
                 # Highlight current song
                 if song_idx == current_index:
-                    self.screen.addstr(text_y_pos, 0, " " * self.screen_width, curses.color_pair(7))
+                    # Pad the row to full width so the highlight is one write
                     play_symbol = self.theme_manager.get_symbol('playing')
-                    self.screen.addstr(text_y_pos, 0, f"{play_symbol} {song_text}", curses.color_pair(7))
+                    row_text = f"{play_symbol} {song_text}".ljust(width)
+                    addstr(text_y_pos, 0, row_text, current_color)
                 else:
-                    self.screen.addstr(text_y_pos, 0, f"  {song_text}", curses.color_pair(1))
+                    addstr(text_y_pos, 0, f"  {song_text}", row_color)
     
     def _draw_controls(self, y_pos, is_playing=False, is_paused=False, volume=100):
         """Draw playback controls with status indicators"""
         if not self.screen:
             return
             
+        # The line only changes with this state; reuse last frame's layout
+        key = (is_playing, is_paused, volume, self.screen_width, self.theme_manager.current_theme)
+        if key == self._controls_cache[0]:
+            x_pos, controls_text = self._controls_cache[1]
+            self._addstr_clipped(y_pos, x_pos, controls_text, curses.color_pair(6))
+            return
+        
         # Get control symbols
         play_symbol = self.theme_manager.get_symbol('playing')
         pause_symbol = self.theme_manager.get_symbol('paused')
@@ -772,22 +951,30 @@ class UI:
         current_symbol = pause_symbol if is_paused else play_symbol if is_playing else stop_symbol
         controls_text = f"{prev_symbol} {current_symbol} {next_symbol} {shuffle_symbol}  {vol_symbol}: {volume}%"
         
-        x_pos = (self.screen_width - len(controls_text)) // 2
-        self.screen.addstr(y_pos, x_pos, controls_text, curses.color_pair(6))
+        x_pos = self._center_x(len(controls_text))
+        self._controls_cache = (key, (x_pos, controls_text))
+        self._addstr_clipped(y_pos, x_pos, controls_text, curses.color_pair(6))
     
     def _draw_status(self, y_pos, shuffle_mode=False, auto_download=False, downloaded=0, total=0):
         """Draw status information line"""
         if not self.screen:
             return
             
+        key = (shuffle_mode, auto_download, downloaded, total, self.screen_width)
+        if key == self._status_cache[0]:
+            x_pos, status_text = self._status_cache[1]
+            self._addstr_clipped(y_pos, x_pos, status_text, curses.color_pair(1))
+            return
+        
         # Format status info
         shuffle_status = "SHUFFLE: ON" if shuffle_mode else "SHUFFLE: OFF"
         download_status = "AUTO-DL: ON" if auto_download else "AUTO-DL: OFF"
         cache_status = f"CACHED: {downloaded}/{total}"
         
         status_text = f"{shuffle_status} | {download_status} | {cache_status}"
-        x_pos = (self.screen_width - len(status_text)) // 2
-        self.screen.addstr(y_pos, x_pos, status_text, curses.color_pair(1))
+        x_pos = self._center_x(len(status_text))
+        self._status_cache = (key, (x_pos, status_text))
+        self._addstr_clipped(y_pos, x_pos, status_text, curses.color_pair(1))
     
     def render_playing_state(self, songs, current_index, shuffle_mode, current_time, 
                            current_song, playback_source, auto_download, downloaded, total,
@@ -796,95 +983,117 @@ class UI:
         if not self.screen:
             return
             
-        try:
-            self.screen.clear()
-            self._draw_header()
-            
-            base_y = 2  # Start after header
-            
-            # Draw song info
-            self._draw_song_info(current_song, base_y, playback_source)
-            
-            # Draw progress bar
-            duration = current_song.get("duration", "00:00")
-            self._draw_progress_bar(current_time, duration, base_y + 3, is_paused)
-            
-            # Draw controls
-            self._draw_controls(base_y + 5, True, is_paused, volume)
+        animated = (self.visualizer_enabled and visualizer_data) or (self.equalizer_enabled and eq_data)
+        # Everything the frame below depends on; when none of it changed and
+        # nothing is animating, the screen already shows this frame
+        frame_key = (
+            current_index, current_time, is_paused, volume, shuffle_mode,
+            auto_download, downloaded, total, playback_source, id(current_song),
+            current_song.get("title"), current_song.get("artist"), current_song.get("duration"),
+            len(songs), self.screen_width, self.screen_height, self.input_buffer,
+            self.show_help, self.theme_manager.current_theme, self.visualizer_enabled,
+            self.equalizer_enabled, self._message_serial,
+        )
             
-            # Draw status
-            self._draw_status(base_y + 7, shuffle_mode, auto_download, downloaded, total)
-            
-            # Draw visualizer if enabled
-            vis_height = 0
-            if self.visualizer_enabled and visualizer_data:
-                self._draw_visualizer(visualizer_data, base_y + 9)
-                vis_height = 6
-            
-            # Draw equalizer if enabled
-            if self.equalizer_enabled and eq_data:
-                self._draw_equalizer(eq_data, base_y + 9 + vis_height)
-                vis_height += 6
-            
-            # Draw playlist
-            playlist_y = base_y + 9 + vis_height
-            available_height = self.screen_height - playlist_y - 7
-            self._draw_playlist(songs, current_index, playlist_y, available_height)
-            
-            # Draw messages and footer
-            self._draw_messages()
-            self._draw_footer()
-            
-            self.screen.refresh()
-        except Exception as e:
-            self.add_message(f"UI Error: {str(e)}", error=True)
+        with self.render_lock:
+            if not animated and frame_key == self._last_frame_key:
+                return
+            try:
+                self.screen.erase()
+                self._draw_header()
+                
+                # Draw song info
+                self._draw_song_info(current_song, self._SONG_Y, playback_source)
+                
+                # Draw progress bar
+                duration = current_song.get("duration", "00:00")
+                self._draw_progress_bar(current_time, duration, self._PROGRESS_Y, is_paused)
+                
+                # Draw controls
+                self._draw_controls(self._CONTROLS_Y, True, is_paused, volume)
+                
+                # Draw status
+                self._draw_status(self._STATUS_Y, shuffle_mode, auto_download, downloaded, total)
+                
+                # Draw visualizer if enabled
+                panel_y = self._PANELS_Y
+                if self.visualizer_enabled and visualizer_data:
+                    self._draw_visualizer(visualizer_data, panel_y)
+                    panel_y += self._PANEL_HEIGHT
+                
+                # Draw equalizer if enabled
+                if self.equalizer_enabled and eq_data:
+                    self._draw_equalizer(eq_data, panel_y)
+                    panel_y += self._PANEL_HEIGHT
+                
+                # Draw playlist below whichever panels were drawn
+                playlist_y = panel_y
+                available_height = self.screen_height - playlist_y - 7
+                self._draw_playlist(songs, current_index, playlist_y, available_height)
+                
+                # Draw messages and footer
+                self._draw_messages()
+                self._draw_footer()
+                
+                self.screen.refresh()
+                self._last_frame_key = frame_key
+            except Exception as e:
+                self._last_frame_key = None
+                self.add_message(f"UI Error: {str(e)}", error=True)
     
     def render_idle_state(self, songs, current_index, shuffle_mode, auto_download, downloaded):
         """Render the idle state UI"""
         if not self.screen:
             return
+        self._last_frame_key = None
             
-        try:
-            self.screen.clear()
-            self._draw_header()
-            
-            idle_msg = "♫ Ready to play music ♫"
-            x_pos = (self.screen_width - len(idle_msg)) // 2
-            self.screen.addstr(3, x_pos, idle_msg, curses.color_pair(2) | curses.A_BOLD)
-            
-            self._draw_status(5, shuffle_mode, auto_download, downloaded, len(songs))
-            
-            available_height = self.screen_height - 15
-            self._draw_playlist(songs, current_index, 7, available_height)
-            
-            self._draw_messages()
-            self._draw_footer()
-            
-            self.screen.refresh()
-        except Exception as e:
-            self.add_message(f"UI Error: {str(e)}", error=True)
+        with self.render_lock:
+            try:
+                self.screen.erase()
+                self._draw_header()
+                
+                self._addstr_clipped(3, self._idle_msg_x, self._IDLE_MSG, curses.color_pair(2) | curses.A_BOLD)
+                
+                self._draw_status(5, shuffle_mode, auto_download, downloaded, len(songs))
+                
+                available_height = self.screen_height - 15
+                self._draw_playlist(songs, current_index, 7, available_height)
+                
+                self._draw_messages()
+                self._draw_footer()
+                
+                self.screen.refresh()
+            except Exception as e:
+                self.add_message(f"UI Error: {str(e)}", error=True)
     
     def render_processing_state(self, operation):
         """Render processing/loading state"""
         if not self.screen:
             return
+        self._last_frame_key = None
             
-        try:
-            self.screen.clear()
-            self._draw_header()
-            
-            msg = f"Processing: {operation}"
-            x_pos = (self.screen_width - len(msg)) // 2
-            self.screen.addstr(self.screen_height // 2, x_pos, msg, curses.color_pair(3) | curses.A_BOLD)
-            
-            # Draw spinner animation
-            spinner = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-            idx = int(time.time() * 10) % len(spinner)
-            self.screen.addstr(self.screen_height // 2 + 2, self.screen_width // 2, spinner[idx], curses.color_pair(2))
-            
-            self.screen.refresh()
-        except Exception as e:
-            self.add_message(f"UI Error: {str(e)}", error=True)
+        with self.render_lock:
+            try:
+                # erase(), not clear(): only the spinner cell changes per frame
+                self.screen.erase()
+                self._draw_header()
+                
+                # The message only changes with the operation or the width
+                key = (operation, self.screen_width)
+                if key != self._processing_cache[0]:
+                    msg = f"Processing: {operation}"
+                    self._processing_cache = (key, (self._center_x(len(msg)), msg))
+                x_pos, msg = self._processing_cache[1]
+                self._addstr_clipped(self.screen_height // 2, x_pos, msg,
+                                     curses.color_pair(3) | curses.A_BOLD)
+                
+                # Draw spinner animation
+                frame = _SPINNER[time.monotonic_ns() // 100_000_000 % len(_SPINNER)]
+                self.screen.addstr(self.screen_height // 2 + 2, self.screen_width // 2, frame, curses.color_pair(2))
+                
+                self.screen.refresh()
+            except Exception as e:
+                self.add_message(f"UI Error: {str(e)}", error=True)
     
     def add_song_form(self):
         """Display form to add a new song"""
@@ -912,42 +1121,66 @@ class UI:
             return None
             
         self.form_active = True
+        # Edits go to a per-field character list; joined only for display
+        # Labels never change while the form is open; build them once
+        for field in fields:
+            field["buf"] = list(field["value"])
+            field["_prefix"] = f"{field['label']}{'*' if field['required'] else ''}: "
+            field["_val_col"] = 2 + len(field["_prefix"])
         self.form_fields = fields
         self.form_title = title
         self.form_current_field = 0
         self.form_result = None
         
+        self._draw_form()
         while self.form_active:
-            self._draw_form()
             key = self.screen.getch()
-            self._process_form_key(key)
+            if key == -1:
+                # getch timed out; nothing changed, so nothing to redraw
+                continue
+            # Apply every key already queued (auto-repeat, pastes) before
+            # drawing, so a backlog costs one redraw instead of one per key
+            previous_field = self.form_current_field
+            full_redraw = False
+            self.screen.nodelay(True)
+            try:
+                while key != -1 and self.form_active:
+                    if key == curses.KEY_RESIZE:
+                        self._handle_resize()
+                        full_redraw = True
+                    else:
+                        self._process_form_key(key)
+                    key = self.screen.getch()
+            finally:
+                self.screen.timeout(300)
+            if not self.form_active:
+                break
+            if full_redraw:
+                self._draw_form()
+            else:
+                # Only the active field's value (and, after Tab, the field
+                # that lost focus) can have changed
+                self._draw_form_rows({previous_field, self.form_current_field})
         
-        return tuple(field["value"] for field in self.form_result) if self.form_result else None
+        return tuple("".join(field["buf"]) for field in self.form_result) if self.form_result else None
     
     def _draw_form(self):
         """Draw form UI"""
         if not self.screen:
             return
+        self._last_frame_key = None
             
         try:
-            self.screen.clear()
+            # erase() lets curses send only the changed cells; clear() would
+            # repaint the whole terminal on every keystroke
+            self.screen.erase()
             self._draw_header()
             
             self.screen.addstr(2, 2, f"── {self.form_title} ──", curses.color_pair(2) | curses.A_BOLD)
             
             for i, field in enumerate(self.form_fields):
-                label = field["label"]
-                value = field["value"]
-                required = field["required"]
-                
-                req_mark = "*" if required else ""
-                self.screen.addstr(4 + i * 2, 2, f"{label}{req_mark}: ", curses.color_pair(1))
-                
-                if i == self.form_current_field:
-                    self.screen.addstr(4 + i * 2, len(label) + 4, value, curses.color_pair(7))
-                    self.screen.addstr(4 + i * 2, len(label) + 4 + len(value), " ", curses.color_pair(7))
-                else:
-                    self.screen.addstr(4 + i * 2, len(label) + 4, value, curses.color_pair(1))
+                self.screen.addstr(4 + i * 2, 2, field["_prefix"], curses.color_pair(1))
+                self._draw_form_value(i)
             
             help_text = "Tab: Next field | Enter: Submit | Esc: Cancel"
             self.screen.addstr(4 + len(self.form_fields) * 2 + 1, 2, help_text, curses.color_pair(6))
@@ -956,22 +1189,47 @@ class UI:
         except Exception as e:
             self.add_message(f"Form Error: {str(e)}", error=True)
     
+    def _draw_form_rows(self, rows):
+        """Redraw just the values of the given form fields"""
+        try:
+            for i in rows:
+                self._draw_form_value(i)
+            self.screen.refresh()
+        except Exception as e:
+            self.add_message(f"Form Error: {str(e)}", error=True)
+    
+    def _draw_form_value(self, i):
+        """Draw one field's value, highlighted with a cursor cell when active"""
+        field = self.form_fields[i]
+        y = 4 + i * 2
+        x = field["_val_col"]
+        value = "".join(field["buf"])
+        # Clear what a longer previous value (or the cursor cell) left behind
+        self.screen.move(y, x)
+        self.screen.clrtoeol()
+        if i == self.form_current_field:
+            self.screen.addstr(y, x, value, curses.color_pair(7))
+            self.screen.addstr(y, x + len(value), " ", curses.color_pair(7))
+        else:
+            self.screen.addstr(y, x, value, curses.color_pair(1))
+    
     def _process_form_key(self, key):
         """Process form key input"""
         if key == 9:  # Tab
             self.form_current_field = (self.form_current_field + 1) % len(self.form_fields)
         elif key == 10:  # Enter
-            all_filled = all(not field["required"] or field["value"] for field in self.form_fields)
+            all_filled = all(not field["required"] or field["buf"] for field in self.form_fields)
             if all_filled:
                 self.form_result = self.form_fields
                 self.form_active = False
         elif key == 27:  # Escape
             self.form_active = False
         elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-            if self.form_fields[self.form_current_field]["value"]:
-                self.form_fields[self.form_current_field]["value"] = self.form_fields[self.form_current_field]["value"][:-1]
+            buf = self.form_fields[self.form_current_field]["buf"]
+            if buf:
+                buf.pop()
         elif 32 <= key <= 126:  # Printable ASCII
-            self.form_fields[self.form_current_field]["value"] += chr(key)
+            self.form_fields[self.form_current_field]["buf"].append(_ASCII_CHARS[key])
     
     def confirm_delete(self, song):
         """Display confirmation dialog for deletion"""
@@ -989,66 +1247,95 @@ class UI:
         """Show a dialog with options"""
         if not self.screen:
             return -1
+        self._last_frame_key = None
             
         selected = 0
         dialog_active = True
+        redraw_all = True
+        changed_rows = ()
         
         while dialog_active:
             try:
-                width = max(len(title), len(message), 40)
-                height = 6 + len(options)
-                x = (self.screen_width - width) // 2
-                y = (self.screen_height - height) // 2
-                
-                # Clear dialog area
-                for i in range(height):
-                    self.screen.addstr(y + i, x, " " * width, curses.color_pair(1))
-                
-                # Draw border
-                for i in range(width):
-                    self.screen.addstr(y, x + i, "─", curses.color_pair(2))
-                    self.screen.addstr(y + height - 1, x + i, "─", curses.color_pair(2))
-                
-                for i in range(height):
-                    self.screen.addstr(y + i, x, "│", curses.color_pair(2))
-                    self.screen.addstr(y + i, x + width - 1, "│", curses.color_pair(2))
-                
-                # Draw corners
-                self.screen.addstr(y, x, "┌", curses.color_pair(2))
-                self.screen.addstr(y, x + width - 1, "┐", curses.color_pair(2))
-                self.screen.addstr(y + height - 1, x, "└", curses.color_pair(2))
-                self.screen.addstr(y + height - 1, x + width - 1, "┘", curses.color_pair(2))
-                
-                # Draw title and message
-                title_x = x + (width - len(title)) // 2
-                self.screen.addstr(y + 1, title_x, title, curses.color_pair(2) | curses.A_BOLD)
-                
-                msg_x = x + (width - len(message)) // 2
-                self.screen.addstr(y + 3, msg_x, message, curses.color_pair(1))
+                if redraw_all:
+                    width = max(len(title), len(message), 40)
+                    height = 6 + len(options)
+                    x = (self.screen_width - width) // 2
+                    y = (self.screen_height - height) // 2
+                    # A subwindow over the dialog area: box() draws the whole
+                    # frame in one call and content uses local coordinates
+                    dialog = self.screen.derwin(height, width, y, x)
+                    # The frame, title and message never change while the
+                    # dialog is open; draw them once (again after a resize)
+                    self._dialog_draw_static(dialog, width, title, message)
+                    # (column, plain text, selected text) per option
+                    option_rows = [
+                        ((width - len(option)) // 2, option, f"> {option} <")
+                        for option in options
+                    ]
+                    changed_rows = range(len(options))
+                    redraw_all = False
                 
-                # Draw options
-                for i, option in enumerate(options):
-                    opt_x = x + (width - len(option)) // 2
-                    if i == selected:
-                        self.screen.addstr(y + 5 + i, opt_x - 2, f"> {option} <", curses.color_pair(7))
-                    else:
-                        self.screen.addstr(y + 5 + i, opt_x, option, curses.color_pair(1))
-                
-                self.screen.refresh()
+                if changed_rows:
+                    # Only the rows whose selection state changed
+                    self._dialog_draw_options(dialog, width, option_rows, selected, changed_rows)
+                    dialog.noutrefresh()
+                    curses.doupdate()
+                    changed_rows = ()
                 
-                # Process input
+                # Process input; keys already queued are applied before the
+                # next redraw, so held arrow keys do not back up the screen
+                previous = selected
                 key = self.screen.getch()
-                if key == curses.KEY_LEFT or key == curses.KEY_UP:
-                    selected = max(0, selected - 1)
-                elif key == curses.KEY_RIGHT or key == curses.KEY_DOWN:
-                    selected = min(len(options) - 1, selected + 1)
-                elif key == 10:  # Enter
-                    dialog_active = False
-                elif key == 27:  # Escape
-                    selected = -1
-                    dialog_active = False
+                self.screen.nodelay(True)
+                try:
+                    while key != -1 and dialog_active:
+                        if key == curses.KEY_LEFT or key == curses.KEY_UP:
+                            selected = max(0, selected - 1)
+                        elif key == curses.KEY_RIGHT or key == curses.KEY_DOWN:
+                            selected = min(len(options) - 1, selected + 1)
+                        elif key == 10:  # Enter
+                            dialog_active = False
+                        elif key == 27:  # Escape
+                            selected = -1
+                            dialog_active = False
+                        elif key == curses.KEY_RESIZE:
+                            self._handle_resize()
+                            redraw_all = True
+                        if dialog_active:
+                            key = self.screen.getch()
+                finally:
+                    self.screen.timeout(300)
+                
+                if dialog_active and selected != previous:
+                    changed_rows = (previous, selected)
             except Exception as e:
                 self.add_message(f"Dialog Error: {str(e)}", error=True)
                 return -1
         
         return selected
+    
+    def _dialog_draw_static(self, dialog, width, title, message):
+        """Draw a dialog's background, border, title and message"""
+        dialog.bkgdset(" ", curses.color_pair(1))
+        dialog.erase()
+        
+        # Frame in one call, using the terminal's line-drawing characters
+        dialog.attrset(curses.color_pair(2))
+        dialog.box()
+        dialog.attrset(0)
+        
+        # Draw title and message
+        dialog.addstr(1, (width - len(title)) // 2, title, curses.color_pair(2) | curses.A_BOLD)
+        dialog.addstr(3, (width - len(message)) // 2, message, curses.color_pair(1))
+    
+    def _dialog_draw_options(self, dialog, width, option_rows, selected, rows):
+        """Redraw the given option rows inside the dialog border"""
+        blank = " " * (width - 2)
+        for i in rows:
+            opt_x, plain, highlighted = option_rows[i]
+            # Blank the row first; the selected form is wider than the plain one
+            dialog.addstr(5 + i, 1, blank, curses.color_pair(1))
+            if i == selected:
+                dialog.addstr(5 + i, opt_x - 2, highlighted, curses.color_pair(7))
+            else:
+                dialog.addstr(5 + i, opt_x, plain, curses.color_pair(1))